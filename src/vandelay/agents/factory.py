@@ -2,35 +2,74 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
-from collections.abc import Callable
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from agno.agent import Agent
+from agno.team import Team
 
 from vandelay.agents.prompts.system_prompt import (
     build_system_prompt,
     build_team_leader_prompt,
 )
+from vandelay.config.constants import MODEL_PROVIDERS
 from vandelay.config.models import MemberConfig
+from vandelay.knowledge.embedder import create_embedder
+from vandelay.knowledge.setup import create_knowledge
 from vandelay.memory.setup import create_db
+from vandelay.tools.manager import ToolManager
+from vandelay.tools.member_management import MemberManagementTools
+from vandelay.tools.tool_management import ToolManagementTools
+from vandelay.tools.tool_request import ToolRequestTools
+from vandelay.tools.workspace import WorkspaceTools
 
 if TYPE_CHECKING:
     from vandelay.config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
-# Named presets: maps known member names to their default tools and roles
-_PRESET_TOOL_MAP: dict[str, list[str]] = {
-    "vandelay-expert": ["file", "python", "shell"],
-}
+# Named presets: maps known member names to their default tools and roles.
+# Read-only — MemberConfig validation turns the tool tuples into fresh lists,
+# so resolved members can be edited without touching the presets.
+_PRESET_TOOL_MAP: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "vandelay-expert": ("file", "python", "shell"),
+})
 
-_PRESET_ROLE_MAP: dict[str, str] = {
+_PRESET_ROLE_MAP: Mapping[str, str] = MappingProxyType({
     "vandelay-expert": (
         "Agent builder — designs, creates, tests, and improves team member agents"
     ),
-}
+})
+
+# Prebuilt MemberConfigs for the presets. _resolve_member hands out copies
+# with fresh lists, so validation runs once at import instead of per rebuild.
+_PRESET_MEMBERS: Mapping[str, MemberConfig] = MappingProxyType({
+    name: MemberConfig(name=name, role=_PRESET_ROLE_MAP.get(name, ""), tools=tools)
+    for name, tools in _PRESET_TOOL_MAP.items()
+})
+
+
+# Shared pool for the independent setup steps of create_agent/create_team
+# (db open, model client, prompt assembly, team member agents). Kept alive across hot-reloads so
+# rebuilding the agent doesn't pay thread start-up again.
+_init_executor: ThreadPoolExecutor | None = None
+
+
+def _get_init_executor() -> ThreadPoolExecutor:
+    """Return the module-level executor used to parallelize agent setup."""
+    global _init_executor
+    if _init_executor is None:
+        _init_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="vandelay-init")
+    return _init_executor
 
 
 def _get_codex_token() -> str | None:
@@ -106,31 +145,66 @@ def _get_codex_token() -> str | None:
         return None
 
 
+# (path, mtime_ns, size) of the last .env applied to os.environ. Every model
+# build calls _load_env(), so an unchanged file is only parsed once; edits
+# (e.g. a newly added API key) still change the stamp and get picked up.
+_env_stamp: tuple[str, int, int] | None = None
+
+
 def _load_env() -> None:
     """Load ~/.vandelay/.env into os.environ so API keys are always available."""
-    import os
+    global _env_stamp
 
     from vandelay.config.constants import VANDELAY_HOME
+    from vandelay.config.env_utils import iter_env_pairs
 
     # Suppress noisy HuggingFace symlink warning on Windows
     os.environ.setdefault("HF_HUB_DISABLE_SYMLINKS_WARNING", "1")
 
     env_path = VANDELAY_HOME / ".env"
-    if not env_path.exists():
+    try:
+        st = env_path.stat()
+    except OSError:
+        return
+    stamp = (str(env_path), st.st_mtime_ns, st.st_size)
+    if stamp == _env_stamp:
         return
-    for line in env_path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, _, value = line.partition("=")
-        key = key.strip()
-        # Strip inline comments (e.g. VALUE=foo  # comment)
-        if " #" in value:
-            value = value[:value.index(" #")]
-        value = value.strip()
+
+    # Raw bytes straight into the regex parser — no universal-newline pass
+    raw = env_path.read_bytes().decode("utf-8", errors="replace")
+    for key, value in iter_env_pairs(raw):
         # Don't overwrite existing env vars (env vars take priority)
-        if key and key not in os.environ:
-            os.environ[key] = value
+        os.environ.setdefault(key, value)
+    _env_stamp = stamp
+
+
+# Provider -> (module, class). Resolved on first use so only the SDK for the
+# configured provider is ever imported. "codex" is the ChatGPT-subscription
+# variant of the openai provider.
+_MODEL_CLASSES: dict[str, tuple[str, str]] = {
+    "anthropic": ("agno.models.anthropic", "Claude"),
+    "openai": ("agno.models.openai", "OpenAIChat"),
+    "codex": ("vandelay.models.openai_codex", "CodexModel"),
+    "google": ("agno.models.google", "Gemini"),
+    "ollama": ("agno.models.ollama", "Ollama"),
+    "groq": ("agno.models.groq", "Groq"),
+    "deepseek": ("agno.models.deepseek", "DeepSeek"),
+    "mistral": ("agno.models.mistral", "MistralChat"),
+    "together": ("agno.models.together", "Together"),
+    "xai": ("agno.models.xai", "xAI"),
+    "openrouter": ("agno.models.openai", "OpenAIChat"),
+}
+
+
+@cache
+def _model_class(provider: str) -> type:
+    """Import and return the model class registered for *provider*.
+
+    Memoized, so after the first build a provider's class is a dict hit with
+    no import-system lookup.
+    """
+    module_path, class_name = _MODEL_CLASSES[provider]
+    return getattr(importlib.import_module(module_path), class_name)
 
 
 def _get_model_from_config(provider: str, model_id: str, auth_method: str = "api_key"):
@@ -138,78 +212,69 @@ def _get_model_from_config(provider: str, model_id: str, auth_method: str = "api
 
     This is the low-level model factory used by both _get_model() (for the main
     agent) and _build_member_agent() (for per-member model overrides).
+    Identical configurations share a single model instance (see _build_model).
     """
-    import os
-
     _load_env()
 
-    if provider == "anthropic":
-        from agno.models.anthropic import Claude
+    env_key = MODEL_PROVIDERS.get(provider, {}).get("env_key")
+    api_key = os.environ.get(env_key) if env_key else None
+    return _build_model(provider, model_id, auth_method, api_key)
 
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        return Claude(id=model_id, api_key=api_key) if api_key else Claude(id=model_id)
 
-    if provider == "openai":
-        if auth_method == "codex":
-            from vandelay.models.openai_codex import CodexModel
+def _build_openai(model_id: str, auth_method: str, api_key: str | None):
+    # ChatGPT-subscription auth goes through the Codex model instead of the API
+    if auth_method == "codex":
+        return _model_class("codex")(id=model_id)
+    return _model_class("openai")(id=model_id)
 
-            return CodexModel(id=model_id)
 
-        from agno.models.openai import OpenAIChat
-
-        return OpenAIChat(id=model_id)
-
-    if provider == "google":
-        from agno.models.google import Gemini
-
-        return Gemini(id=model_id)
-
-    if provider == "ollama":
-        from agno.models.ollama import Ollama
-
-        return Ollama(id=model_id)
-
-    if provider == "groq":
-        from agno.models.groq import Groq
-
-        api_key = os.environ.get("GROQ_API_KEY")
-        return Groq(id=model_id, api_key=api_key) if api_key else Groq(id=model_id)
-
-    if provider == "deepseek":
-        from agno.models.deepseek import DeepSeek
-
-        api_key = os.environ.get("DEEPSEEK_API_KEY")
-        return DeepSeek(id=model_id, api_key=api_key) if api_key else DeepSeek(id=model_id)
-
-    if provider == "mistral":
-        from agno.models.mistral import MistralChat
-
-        api_key = os.environ.get("MISTRAL_API_KEY")
-        return MistralChat(id=model_id, api_key=api_key) if api_key else MistralChat(id=model_id)
-
-    if provider == "together":
-        from agno.models.together import Together
-
-        api_key = os.environ.get("TOGETHER_API_KEY")
-        return Together(id=model_id, api_key=api_key) if api_key else Together(id=model_id)
-
-    if provider == "xai":
-        from agno.models.xai import xAI
+def _build_openrouter(model_id: str, auth_method: str, api_key: str | None):
+    return _model_class("openrouter")(
+        id=model_id,
+        api_key=api_key,
+        base_url="https://openrouter.ai/api/v1",
+    )
 
-        api_key = os.environ.get("XAI_API_KEY")
-        return xAI(id=model_id, api_key=api_key) if api_key else xAI(id=model_id)
 
-    if provider == "openrouter":
-        from agno.models.openai import OpenAIChat
+def _id_only_builder(provider: str) -> Callable[[str, str, str | None], Any]:
+    """Builder for providers configured by model id alone (no API key)."""
+    def build(model_id: str, auth_method: str, api_key: str | None):
+        return _model_class(provider)(id=model_id)
+    return build
+
+
+def _api_key_builder(provider: str) -> Callable[[str, str, str | None], Any]:
+    """Builder that passes the API key through when one is set."""
+    def build(model_id: str, auth_method: str, api_key: str | None):
+        cls = _model_class(provider)
+        return cls(id=model_id, api_key=api_key) if api_key else cls(id=model_id)
+    return build
+
+
+_MODEL_BUILDERS: dict[str, Callable[[str, str, str | None], Any]] = {
+    "anthropic": _api_key_builder("anthropic"),
+    "openai": _build_openai,
+    "google": _id_only_builder("google"),
+    "ollama": _id_only_builder("ollama"),
+    "groq": _api_key_builder("groq"),
+    "deepseek": _api_key_builder("deepseek"),
+    "mistral": _api_key_builder("mistral"),
+    "together": _api_key_builder("together"),
+    "xai": _api_key_builder("xai"),
+    "openrouter": _build_openrouter,
+}
 
-        api_key = os.environ.get("OPENROUTER_API_KEY")
-        return OpenAIChat(
-            id=model_id,
-            api_key=api_key,
-            base_url="https://openrouter.ai/api/v1",
-        )
 
-    raise ValueError(f"Unknown model provider: {provider}")
+# Model instances (and their HTTP clients) are reused across members and
+# hot-reloads. The resolved API key is part of the cache key so rotating a
+# key in ~/.vandelay/.env builds a fresh client instead of a stale one.
+@lru_cache(maxsize=32)
+def _build_model(provider: str, model_id: str, auth_method: str, api_key: str | None):
+    """Construct the Agno model for a provider. Cached by all four arguments."""
+    builder = _MODEL_BUILDERS.get(provider)
+    if builder is None:
+        raise ValueError(f"Unknown model provider: {provider}")
+    return builder(model_id, auth_method, api_key)
 
 
 def _get_model(settings: Settings):
@@ -221,19 +286,39 @@ def _get_model(settings: Settings):
     )
 
 
+# Shared ToolManager for agent and member builds, so the tool registry is
+# loaded once rather than once per team member on every reload.
+_tool_manager: ToolManager | None = None
+
+
+def _get_tool_manager() -> ToolManager:
+    """Return the shared ToolManager, revalidating its registry against disk."""
+    global _tool_manager
+    if _tool_manager is None:
+        _tool_manager = ToolManager()
+    else:
+        _tool_manager.registry.reload_if_stale()
+    return _tool_manager
+
+
 def _get_tools(settings: Settings) -> list:
     """Instantiate enabled tools from the tool registry."""
     if not settings.enabled_tools:
         return []
 
-    from vandelay.tools.manager import ToolManager
-
-    manager = ToolManager()
+    manager = _get_tool_manager()
     return manager.instantiate_tools(settings.enabled_tools, settings=settings)
 
 
-def _ensure_template_instructions(mc: MemberConfig) -> MemberConfig:
-    """Copy starter template to members dir if not already present."""
+def _ensure_template_instructions(
+    mc: MemberConfig,
+    member_files: Collection[str] | None = None,
+) -> MemberConfig:
+    """Copy starter template to members dir if not already present.
+
+    ``member_files`` is an optional listing of MEMBERS_DIR file names; when
+    given it replaces the per-member existence check.
+    """
     from vandelay.agents.templates import STARTER_TEMPLATES, get_template_content
     from vandelay.config.constants import MEMBERS_DIR
 
@@ -245,7 +330,11 @@ def _ensure_template_instructions(mc: MemberConfig) -> MemberConfig:
         return mc  # Not a known template
 
     instructions_path = MEMBERS_DIR / f"{mc.name}.md"
-    if not instructions_path.exists():
+    if member_files is not None:
+        exists = instructions_path.name in member_files
+    else:
+        exists = instructions_path.exists()
+    if not exists:
         try:
             MEMBERS_DIR.mkdir(parents=True, exist_ok=True)
             content = get_template_content(template.slug)
@@ -259,27 +348,51 @@ def _ensure_template_instructions(mc: MemberConfig) -> MemberConfig:
     return mc
 
 
-def _resolve_member(member: str | MemberConfig) -> MemberConfig:
+def _list_member_files() -> frozenset[str]:
+    """Names of the files in MEMBERS_DIR, read with a single directory scan."""
+    from vandelay.config.constants import MEMBERS_DIR
+
+    try:
+        return frozenset(os.listdir(MEMBERS_DIR))
+    except OSError:
+        return frozenset()
+
+
+def _resolve_member(
+    member: str | MemberConfig,
+    member_files: Collection[str] | None = None,
+) -> MemberConfig:
     """Normalize a member entry to MemberConfig.
 
     String members are resolved via legacy lookup maps so that existing configs
-    like ``["browser", "system"]`` keep working.
+    like ``["browser", "system"]`` keep working. ``member_files`` is passed
+    through to ``_ensure_template_instructions``.
     """
     if isinstance(member, MemberConfig):
         return member
 
-    name = member
-    mc = MemberConfig(
-        name=name,
-        role=_PRESET_ROLE_MAP.get(name, ""),
-        tools=list(_PRESET_TOOL_MAP.get(name, [])),
-    )
+    proto = _PRESET_MEMBERS.get(member)
+    if proto is not None:
+        # Callers append to tools/instructions, so never share the prototype's lists
+        mc = proto.model_copy(
+            update={"tools": list(proto.tools), "instructions": list(proto.instructions)},
+        )
+    else:
+        mc = MemberConfig(name=member)
 
     # Auto-bootstrap template instructions if available
-    mc = _ensure_template_instructions(mc)
+    mc = _ensure_template_instructions(mc, member_files)
     return mc
 
 
+# Member instructions keyed by (path, mtime_ns) — members sharing a file and
+# warm team reloads skip the disk read. Bounded LRU; the lock covers
+# concurrent member builds.
+_INSTRUCTIONS_CACHE: OrderedDict[tuple[str, int], str] = OrderedDict()
+_INSTRUCTIONS_CACHE_MAX = 64
+_instructions_lock = threading.Lock()
+
+
 def _load_instructions_file(instructions_file: str) -> str:
     """Load member instructions from file. Returns empty string on failure."""
     if not instructions_file:
@@ -295,7 +408,13 @@ def _load_instructions_file(instructions_file: str) -> str:
         path = Path(path.expanduser())
 
     try:
-        return path.read_text(encoding="utf-8").strip()
+        key = (str(path), path.stat().st_mtime_ns)
+        with _instructions_lock:
+            cached = _INSTRUCTIONS_CACHE.get(key)
+            if cached is not None:
+                _INSTRUCTIONS_CACHE.move_to_end(key)
+                return cached
+        text = path.read_text(encoding="utf-8").strip()
     except FileNotFoundError:
         logger.warning("Member instructions file not found: %s", path)
         return ""
@@ -303,6 +422,36 @@ def _load_instructions_file(instructions_file: str) -> str:
         logger.warning("Failed to read member instructions file %s: %s", path, exc)
         return ""
 
+    with _instructions_lock:
+        _INSTRUCTIONS_CACHE[key] = text
+        while len(_INSTRUCTIONS_CACHE) > _INSTRUCTIONS_CACHE_MAX:
+            _INSTRUCTIONS_CACHE.popitem(last=False)
+    return text
+
+
+@lru_cache(maxsize=32)
+def _tag_preamble(tag: str) -> str:
+    """Opening instruction that makes a member prefix replies with its tag."""
+    return (
+        f"You are the [{tag}] specialist. Always prefix your responses with [{tag}] "
+        f"so the user knows which team member is speaking."
+    )
+
+
+@lru_cache(maxsize=64)
+def _tools_instruction(tool_names: tuple[str, ...]) -> str:
+    """Tool-awareness instruction listing exactly the tools a member has."""
+    tools_str = ", ".join(tool_names)
+    return (
+        f"Your available tools: {tools_str}. "
+        "Their full method signatures are already in your function "
+        "definitions. Call them directly — NEVER read source code, "
+        "run shell commands to inspect packages, or write Python "
+        "scripts to replicate what a tool already does. "
+        "If a task requires a tool you don't have, call "
+        "request_tool(tool_name, reason) to ask the leader for it."
+    )
+
 
 def _build_member_agent(
     mc: MemberConfig,
@@ -314,9 +463,18 @@ def _build_member_agent(
     extra_tools: list | None = None,
     scheduler_engine: object | None = None,
     task_store: object | None = None,
+    enabled_tools_set: frozenset[str] | None = None,
+    personality_brief: str = "",
 ) -> Agent:
-    """Create an Agent from a MemberConfig."""
-    from vandelay.tools.manager import ToolManager
+    """Create an Agent from a MemberConfig.
+
+    ``enabled_tools_set`` lets callers building several members pass a
+    precomputed ``frozenset(settings.enabled_tools)``. ``personality_brief``
+    is the SOUL.md excerpt from ``build_personality_brief``; callers build it
+    once and share it across members.
+    """
+    name = mc.name
+    title = name.title()
 
     # Resolve model: per-member override or inherit main
     if mc.model_provider and mc.model_id:
@@ -326,9 +484,11 @@ def _build_member_agent(
 
     # Resolve tools: intersect with enabled_tools so disabled tools aren't used
     tools: list = []
-    tool_names = [t for t in mc.tools if t in settings.enabled_tools]
+    if enabled_tools_set is None:
+        enabled_tools_set = frozenset(settings.enabled_tools)
+    tool_names = [t for t in mc.tools if t in enabled_tools_set]
     if tool_names:
-        manager = ToolManager()
+        manager = _get_tool_manager()
         tools = manager.instantiate_tools(tool_names, settings=settings)
 
     # All members get task queue tools
@@ -338,33 +498,21 @@ def _build_member_agent(
         tools.append(TaskQueueTools(store=task_store))
 
     # All members can request tools from the leader
-    from vandelay.tools.tool_request import ToolRequestTools
-
-    tools.append(ToolRequestTools(settings=settings, member_name=mc.name))
+    tools.append(ToolRequestTools(settings=settings, member_name=name))
 
     # Inject any caller-provided extra tools (e.g., KnowledgeManagementTools for vandelay-expert)
     if extra_tools:
         tools.extend(extra_tools)
 
-    # Build instructions: tag → tool awareness → file contents → inline
-    tag = mc.name.upper()
-    instructions: list[str] = [
-        f"You are the [{tag}] specialist. Always prefix your responses with [{tag}] "
-        f"so the user knows which team member is speaking.",
-    ]
+    # Build instructions: tag → personality → tool awareness → file contents → inline
+    instructions: list[str] = [_tag_preamble(name.upper())]
+
+    if personality_brief:
+        instructions.append(personality_brief)
 
     # Tool awareness: tell the member exactly what tools it has
     if tool_names:
-        tools_str = ", ".join(tool_names)
-        instructions.append(
-            f"Your available tools: {tools_str}. "
-            "Their full method signatures are already in your function "
-            "definitions. Call them directly — NEVER read source code, "
-            "run shell commands to inspect packages, or write Python "
-            "scripts to replicate what a tool already does. "
-            "If a task requires a tool you don't have, call "
-            "request_tool(tool_name, reason) to ask the leader for it."
-        )
+        instructions.append(_tools_instruction(tuple(tool_names)))
 
     file_content = _load_instructions_file(mc.instructions_file)
     if file_content:
@@ -373,10 +521,10 @@ def _build_member_agent(
     instructions.extend(mc.instructions)
 
     return Agent(
-        id=f"vandelay-{mc.name}",
-        name=f"{mc.name.title()} Specialist",
-        role=mc.role or f"{mc.name.title()} specialist",
-        user_id=f"member_{mc.name}",
+        id=f"vandelay-{name}",
+        name=f"{title} Specialist",
+        role=mc.role or f"{title} specialist",
+        user_id=f"member_{name}",
         model=model,
         db=db,
         knowledge=knowledge,
@@ -392,6 +540,37 @@ def _build_member_agent(
     )
 
 
+def _collaborator_tools(
+    settings: Settings,
+    *,
+    scheduler_engine: object | None,
+    task_store: object | None,
+    channel_router: object | None,
+) -> list:
+    """Toolkits for the optional runtime collaborators shared by agent and leader.
+
+    SchedulerTools when an engine is running, TaskQueueTools when a task store
+    is available, and NotifyTools when a channel router can deliver proactive
+    messages.
+    """
+    tools: list = []
+    if scheduler_engine is not None:
+        from vandelay.tools.scheduler import SchedulerTools
+
+        tools.append(SchedulerTools(engine=scheduler_engine, default_timezone=settings.timezone))
+
+    if task_store is not None:
+        from vandelay.tools.tasks import TaskQueueTools
+
+        tools.append(TaskQueueTools(store=task_store))
+
+    if channel_router is not None:
+        from vandelay.tools.notify import NotifyTools
+
+        tools.append(NotifyTools(channel_router=channel_router))
+    return tools
+
+
 def create_agent(
     settings: Settings,
     reload_callback: Callable[[], None] | None = None,
@@ -412,50 +591,43 @@ def create_agent(
         channel_router: Optional ChannelRouter instance. When provided,
             NotifyTools are added so the agent can send proactive messages.
     """
-    from vandelay.tools.tool_management import ToolManagementTools
-    from vandelay.tools.workspace import WorkspaceTools
+    # Populate os.environ before fanning out so tool constructors on this
+    # thread see the same API keys the model worker does.
+    _load_env()
 
-    db = create_db(settings)
-    model = _get_model(settings)
-    workspace_dir = Path(settings.workspace_dir)
-    instructions = build_system_prompt(
+    # db, model and prompt are independent — build them on the init pool while
+    # tools are instantiated here.
+    executor = _get_init_executor()
+    f_db = executor.submit(create_db, settings)
+    f_model = executor.submit(_get_model, settings)
+    f_instructions = executor.submit(
+        build_system_prompt,
         agent_name=settings.agent_name,
-        workspace_dir=workspace_dir,
+        workspace_dir=settings.workspace_path,
         settings=settings,
     )
     tools = _get_tools(settings)
+    db = f_db.result()
+    model = f_model.result()
+    instructions = f_instructions.result()
 
-    # Always include the tool management toolkit
+    # Always include the tool management toolkit, plus workspace tools for
+    # persistent memory management
     tool_mgmt = ToolManagementTools(
         settings=settings,
         reload_callback=reload_callback,
     )
-    tools.append(tool_mgmt)
-
-    # Always include workspace tools for persistent memory management
-    tools.append(WorkspaceTools(settings=settings, db=db))
-
-    # Include scheduler tools when engine is available
-    if scheduler_engine is not None:
-        from vandelay.tools.scheduler import SchedulerTools
-
-        tools.append(SchedulerTools(engine=scheduler_engine, default_timezone=settings.timezone))
-
-    # Include task queue tools when store is available
-    if task_store is not None:
-        from vandelay.tools.tasks import TaskQueueTools
-
-        tools.append(TaskQueueTools(store=task_store))
-
-    # Proactive notification tools when channel router is available
-    if channel_router is not None:
-        from vandelay.tools.notify import NotifyTools
+    workspace_tools = WorkspaceTools(settings=settings, db=db)
+    tools.extend([tool_mgmt, workspace_tools])
 
-        tools.append(NotifyTools(channel_router=channel_router))
+    tools.extend(_collaborator_tools(
+        settings,
+        scheduler_engine=scheduler_engine,
+        task_store=task_store,
+        channel_router=channel_router,
+    ))
 
     # Knowledge/RAG
-    from vandelay.knowledge.setup import create_knowledge
-
     knowledge = create_knowledge(settings, db=db)
 
     agent = Agent(
@@ -494,30 +666,55 @@ def create_team(
 
     Returns an object duck-type compatible with Agent (same arun interface).
     """
-    from agno.team import Team
-
-    from vandelay.knowledge.setup import create_knowledge
-    from vandelay.tools.tool_management import ToolManagementTools
-    from vandelay.tools.workspace import WorkspaceTools
+    _load_env()
 
-    db = create_db(settings)
-    model = _get_model(settings)
-    workspace_dir = Path(settings.workspace_dir)
-    instructions = build_team_leader_prompt(
+    # Same fan-out as create_agent: db, model and leader prompt on the init
+    # pool, leader tools on this thread.
+    executor = _get_init_executor()
+    f_db = executor.submit(create_db, settings)
+    f_model = executor.submit(_get_model, settings)
+    f_instructions = executor.submit(
+        build_team_leader_prompt,
         agent_name=settings.agent_name,
-        workspace_dir=workspace_dir,
+        workspace_dir=settings.workspace_path,
         settings=settings,
     )
-    knowledge = create_knowledge(settings, db=db)
 
-    # Build members from config (string or MemberConfig)
-    members = []
+    # Supervisor gets the same user-enabled tools as solo mode so it can
+    # execute tasks directly (e.g. shell commands during heartbeat) without
+    # being forced to delegate everything. It will still delegate to members
+    # when appropriate per its instructions, but won't be blocked when it
+    # needs to act directly.
+    leader_tools: list = _get_tools(settings)
+
+    db = f_db.result()
+    model = f_model.result()
+    instructions = f_instructions.result()
+
+    # Resolve the embedder once for the leader and every member collection —
+    # each create_embedder() call can load a local model. When knowledge is
+    # disabled or no embedder is available, no vector store is opened.
+    embedder = create_embedder(settings) if settings.knowledge.enabled else None
+    if embedder is not None:
+        knowledge = create_knowledge(settings, db=db, embedder=embedder)
+    else:
+        knowledge = None
+
+    # Build members from config (string or MemberConfig). Resolution and
+    # knowledge setup touch shared files/stores, so they stay on this thread;
+    # the Agent construction itself fans out on the init pool.
+    enabled_tools_set = frozenset(settings.enabled_tools)
+    # One directory scan covers every template-backed member's existence check
+    member_files = _list_member_files()
+    member_futures = []
     for entry in settings.team.members:
-        mc = _resolve_member(entry)
+        mc = _resolve_member(entry, member_files)
 
         # Each member gets its own isolated knowledge collection (if enabled)
-        if mc.knowledge_enabled:
-            member_knowledge = create_knowledge(settings, db=db, member_name=mc.name)
+        if mc.knowledge_enabled and embedder is not None:
+            member_knowledge = create_knowledge(
+                settings, db=db, member_name=mc.name, embedder=embedder,
+            )
         else:
             member_knowledge = None
 
@@ -529,7 +726,8 @@ def create_team(
 
             extra_tools.append(KnowledgeManagementTools(settings=settings, db=db))
 
-        agent = _build_member_agent(
+        member_futures.append(executor.submit(
+            _build_member_agent,
             mc,
             main_model=model,
             db=db,
@@ -538,15 +736,9 @@ def create_team(
             settings=settings,
             scheduler_engine=scheduler_engine,
             task_store=task_store,
-        )
-        members.append(agent)
-
-    # Supervisor gets the same user-enabled tools as solo mode so it can
-    # execute tasks directly (e.g. shell commands during heartbeat) without
-    # being forced to delegate everything. It will still delegate to members
-    # when appropriate per its instructions, but won't be blocked when it
-    # needs to act directly.
-    leader_tools: list = _get_tools(settings)
+            enabled_tools_set=enabled_tools_set,
+        ))
+    members = [f.result() for f in member_futures]
 
     tool_mgmt = ToolManagementTools(
         settings=settings,
@@ -556,18 +748,18 @@ def create_team(
     leader_tools.extend([tool_mgmt, workspace_tools])
 
     # Member management tools for the leader
-    from vandelay.tools.member_management import MemberManagementTools
-
     leader_tools.append(MemberManagementTools(
         settings=settings,
         reload_callback=reload_callback,
     ))
 
-    # Task queue tools for the leader
-    if task_store is not None:
-        from vandelay.tools.tasks import TaskQueueTools
-
-        leader_tools.append(TaskQueueTools(store=task_store))
+    # Scheduler, task queue and notification tools — same gating as solo mode
+    leader_tools.extend(_collaborator_tools(
+        settings,
+        scheduler_engine=scheduler_engine,
+        task_store=task_store,
+        channel_router=channel_router,
+    ))
 
     # Deep work tools (when enabled and manager provided)
     if settings.deep_work.enabled and deep_work_manager is not None:
@@ -575,18 +767,6 @@ def create_team(
 
         leader_tools.append(DeepWorkTools(manager=deep_work_manager))
 
-    # Proactive notification tools for the leader
-    if channel_router is not None:
-        from vandelay.tools.notify import NotifyTools
-
-        leader_tools.append(NotifyTools(channel_router=channel_router))
-
-    # Scheduler tools so the leader can create/manage cron jobs directly
-    if scheduler_engine is not None:
-        from vandelay.tools.scheduler import SchedulerTools
-
-        leader_tools.append(SchedulerTools(engine=scheduler_engine, default_timezone=settings.timezone))
-
     # Determine respond_directly based on mode
     mode = settings.team.mode
     respond_directly = mode == "route"
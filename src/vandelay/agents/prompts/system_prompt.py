@@ -3,15 +3,41 @@
 from __future__ import annotations
 
 import contextlib
+import re
+import time
+from collections.abc import Callable
+from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from vandelay.config.env_utils import iter_env_pairs
+from vandelay.tools.registry import get_registry
 from vandelay.workspace.manager import get_template_content
 
 if TYPE_CHECKING:
     from vandelay.config.settings import Settings
 
 
+# SOUL.md sections shared with team members as a personality brief
+_PERSONALITY_SECTIONS = frozenset({"## Core Truths", "## Vibe"})
+
+# Captures each "## " heading line; re.split yields
+# [preamble, heading, body, heading, body, ...].
+_H2_SPLIT = re.compile(r"^(## [^\n]*)", re.MULTILINE)
+
+
+def _keep_h2_sections(text: str, keep: frozenset[str]) -> str:
+    """Return only the ``## `` sections of *text* whose heading is in *keep*."""
+    parts = _H2_SPLIT.split(text)
+    kept = [
+        parts[i] + parts[i + 1]
+        for i in range(1, len(parts), 2)
+        if parts[i].strip() in keep
+    ]
+    return "".join(kept).strip()
+
+
 def build_personality_brief(workspace_dir: Path | None = None) -> str:
     """Extract Core Truths and Vibe sections from SOUL.md for member injection.
 
@@ -22,17 +48,23 @@ def build_personality_brief(workspace_dir: Path | None = None) -> str:
     if not soul:
         return ""
 
-    sections_to_extract = ("## Core Truths", "## Vibe")
-    lines: list[str] = []
-    capturing = False
+    return _keep_h2_sections(soul, _PERSONALITY_SECTIONS)
 
-    for line in soul.splitlines():
-        if line.startswith("## "):
-            capturing = line.strip() in sections_to_extract
-        if capturing:
-            lines.append(line)
 
-    return "\n".join(lines).strip() if lines else ""
+# Static framing of the enabled-tools catalog
+_CATALOG_HEADER = "\n".join([
+    "# Your Enabled Tools",
+    "",
+    "These tools are registered as direct function calls — their full method",
+    "signatures, parameters, and descriptions are already in your function",
+    "definitions. **Do not investigate or look up tool methods.** Just call them.",
+    "",
+])
+_CATALOG_FOOTER = "\n".join([
+    "",
+    "To discover and enable more tools, use `list_available_tools`.",
+    "",
+])
 
 
 def _build_tool_catalog(settings: Settings) -> str:
@@ -40,46 +72,41 @@ def _build_tool_catalog(settings: Settings) -> str:
 
     Marks which tools are currently enabled so the agent knows its own state.
     """
-    from vandelay.tools.registry import ToolRegistry
-
-    registry = ToolRegistry()
-    by_cat = registry.by_category()
-    if not by_cat:
-        return ""
-
-    enabled = set(settings.enabled_tools)
+    tools = get_registry().tools
 
     # Only list enabled tools in the prompt to keep it lean.
     # The agent can use `list_available_tools` to discover others.
-    enabled_entries = []
-    for entries in by_cat.values():
-        for entry in entries:
-            if entry.name in enabled:
-                enabled_entries.append(entry)
+    enabled_entries = [tools[name] for name in set(settings.enabled_tools) if name in tools]
 
     if not enabled_entries:
         return ""
 
-    lines: list[str] = [
-        "# Your Enabled Tools",
-        "",
-        "These tools are registered as direct function calls — their full method",
-        "signatures, parameters, and descriptions are already in your function",
-        "definitions. **Do not investigate or look up tool methods.** Just call them.",
-        "",
-    ]
-
-    for entry in sorted(enabled_entries, key=lambda e: (e.category, e.name)):
+    lines: list[str] = [_CATALOG_HEADER]
+    for entry in sorted(enabled_entries, key=attrgetter("category", "name")):
         lines.append(f"- **{entry.name}** [{entry.category}]")
-
-    lines.append("")
-    lines.append(
-        "To discover and enable more tools, use `list_available_tools`."
-    )
-    lines.append("")
+    lines.append(_CATALOG_FOOTER)
     return "\n".join(lines)
 
 
+_CREDENTIALS_HEADER = "\n".join([
+    "# Your Configured Credentials",
+    "",
+    "These credentials are already set up. **Do NOT ask the user to configure them.**",
+    "Just call the tool directly.",
+    "",
+])
+
+# Common API keys to report on in the credentials summary
+_KEY_LABELS = {
+    "ANTHROPIC_API_KEY": "Anthropic",
+    "OPENAI_API_KEY": "OpenAI",
+    "GOOGLE_API_KEY": "Google AI",
+    "TAVILY_API_KEY": "Tavily (web search)",
+    "GITHUB_TOKEN": "GitHub",
+    "OPENROUTER_API_KEY": "OpenRouter",
+}
+
+
 def _build_credentials_summary() -> str:
     """Scan configured credentials and return a status summary for the prompt.
 
@@ -88,13 +115,7 @@ def _build_credentials_summary() -> str:
     """
     from vandelay.config.constants import VANDELAY_HOME
 
-    lines: list[str] = [
-        "# Your Configured Credentials",
-        "",
-        "These credentials are already set up. **Do NOT ask the user to configure them.**",
-        "Just call the tool directly.",
-        "",
-    ]
+    lines: list[str] = [_CREDENTIALS_HEADER]
 
     # Check Google OAuth token
     google_token = VANDELAY_HOME / "google_token.json"
@@ -111,27 +132,13 @@ def _build_credentials_summary() -> str:
     # Scan .env for known API key patterns
     env_file = VANDELAY_HOME / ".env"
     configured_keys: set[str] = set()
-    if env_file.exists():
-        try:
-            for line in env_file.read_text(encoding="utf-8").splitlines():
-                line = line.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                key = line.partition("=")[0].strip()
-                if key:
-                    configured_keys.add(key.upper())
-        except OSError:
-            pass
-
-    # Common API keys to report on
-    _KEY_LABELS = {
-        "ANTHROPIC_API_KEY": "Anthropic",
-        "OPENAI_API_KEY": "OpenAI",
-        "GOOGLE_API_KEY": "Google AI",
-        "TAVILY_API_KEY": "Tavily (web search)",
-        "GITHUB_TOKEN": "GitHub",
-        "OPENROUTER_API_KEY": "OpenRouter",
-    }
+    try:
+        raw = env_file.read_bytes().decode("utf-8", errors="replace")
+    except OSError:
+        raw = ""
+    for key, _value in iter_env_pairs(raw):
+        configured_keys.add(key.upper())
+
     for key, label in _KEY_LABELS.items():
         if key in configured_keys:
             lines.append(f"- **{label}**: \u2705 configured")
@@ -145,6 +152,118 @@ def _build_credentials_summary() -> str:
     return "\n".join(lines)
 
 
+# Workspace templates the prompt bodies are assembled from. Their mtimes are
+# part of the body cache key below.
+_PROMPT_TEMPLATES = ("SOUL.md", "USER.md", "AGENTS.md", "TOOLS.md", "HEARTBEAT.md")
+
+# Last assembled body per prompt kind ("solo" / "leader"), keyed by everything
+# it is derived from. Hot-reloads after a tool toggle or member edit rebuild
+# it; plain reloads reuse it. The datetime preamble and BOOTSTRAP.md are never
+# part of the cached body.
+_body_cache: dict[str, tuple[tuple, str]] = {}
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _body_cache_key(workspace_dir: Path | None, settings: Settings | None) -> tuple:
+    """Signature of every input a prompt body reads: templates, settings, creds, registry."""
+    from vandelay.config.constants import (
+        CUSTOM_TOOLS_DIR,
+        TOOL_REGISTRY_FILE,
+        VANDELAY_HOME,
+        WORKSPACE_DIR,
+    )
+
+    ws = workspace_dir or WORKSPACE_DIR
+    watched = [ws / name for name in _PROMPT_TEMPLATES]
+    watched += [
+        VANDELAY_HOME / ".env",
+        VANDELAY_HOME / "google_token.json",
+        TOOL_REGISTRY_FILE,
+        CUSTOM_TOOLS_DIR,
+    ]
+    settings_sig = (
+        settings.model_dump_json(include={"enabled_tools", "team", "deep_work"})
+        if settings is not None
+        else None
+    )
+    return (str(ws), str(VANDELAY_HOME), settings_sig, *(_file_stamp(p) for p in watched))
+
+
+# (minute bucket, formatted timestamp). The prompt only shows minutes, so
+# builds within the same minute reuse one strftime.
+_now_cache: tuple[int, str] = (-1, "")
+
+
+def _current_datetime() -> str:
+    global _now_cache
+    bucket = int(time.time()) // 60
+    if _now_cache[0] != bucket:
+        _now_cache = (bucket, datetime.now().strftime("%A, %B %d, %Y %I:%M %p"))
+    return _now_cache[1]
+
+
+def _identity_preamble(agent_name: str) -> str:
+    """Agent identity + current date/time.
+
+    Keeps the agent from falling back to its training-cutoff date when
+    scheduling tasks.
+    """
+    return f"Your name is **{agent_name}**.\n\nCurrent date and time: {_current_datetime()}"
+
+
+def _consume_bootstrap(workspace_dir: Path | None) -> str:
+    """Return BOOTSTRAP.md once and delete it so it never appears again.
+
+    Read directly (no shipped-default fallback) because absence of the file
+    means it has already been used.
+    """
+    if not workspace_dir:
+        return ""
+    bootstrap_path = workspace_dir / "BOOTSTRAP.md"
+    # Runs on every prompt build; after first run the file is gone, so go
+    # straight to the read and let the missing case be the cheap one.
+    try:
+        content = bootstrap_path.read_text(encoding="utf-8")
+    except (FileNotFoundError, IsADirectoryError):
+        return ""
+    with contextlib.suppress(OSError):
+        bootstrap_path.unlink()
+    return content
+
+
+def _assemble_prompt(
+    kind: str,
+    agent_name: str,
+    workspace_dir: Path | None,
+    settings: Settings | None,
+    build_body: Callable[[Path | None, Settings | None], list[str]],
+) -> str:
+    sections = [_identity_preamble(agent_name)]
+
+    key = _body_cache_key(workspace_dir, settings)
+    cached = _body_cache.get(kind)
+    if cached is not None and cached[0] == key:
+        body = cached[1]
+    else:
+        body = "\n\n---\n\n".join(build_body(workspace_dir, settings))
+        _body_cache[kind] = (key, body)
+    if body:
+        sections.append(body)
+
+    bootstrap = _consume_bootstrap(workspace_dir)
+    if bootstrap:
+        sections.append(bootstrap)
+
+    return "\n\n---\n\n".join(sections)
+
+
 def build_system_prompt(
     agent_name: str = "Art",
     workspace_dir: Path | None = None,
@@ -161,14 +280,11 @@ def build_system_prompt(
       6. Curated memory (long-term)
       7. Bootstrap (first-run only, if present)
     """
-    sections: list[str] = []
+    return _assemble_prompt("solo", agent_name, workspace_dir, settings, _build_system_body)
 
-    # Agent identity preamble + current date/time so the agent never
-    # falls back to its training-cutoff date for scheduling tasks.
-    from datetime import datetime
 
-    now = datetime.now().strftime("%A, %B %d, %Y %I:%M %p")
-    sections.append(f"Your name is **{agent_name}**.\n\nCurrent date and time: {now}")
+def _build_system_body(workspace_dir: Path | None, settings: Settings | None) -> list[str]:
+    sections: list[str] = []
 
     soul = get_template_content("SOUL.md", workspace_dir)
     if soul:
@@ -202,28 +318,18 @@ def build_system_prompt(
     if heartbeat:
         sections.append(heartbeat)
 
-    # Bootstrap is included once and then auto-deleted so it never
-    # appears again. We read directly (no shipped-default fallback)
-    # because absence of the file means it has already been used.
-    if workspace_dir:
-        bootstrap_path = workspace_dir / "BOOTSTRAP.md"
-        if bootstrap_path.exists():
-            sections.append(bootstrap_path.read_text(encoding="utf-8"))
-            with contextlib.suppress(OSError):
-                bootstrap_path.unlink()
-
-    return "\n\n---\n\n".join(sections)
+    return sections
 
 
 # Sections to keep in the slim AGENTS.md for the team leader.
 # The leader doesn't need "Working Directory" or "Delegation" — those are
 # replaced by the dynamic member roster.
-_LEADER_AGENTS_SECTIONS = {
+_LEADER_AGENTS_SECTIONS = frozenset({
     "## Workspace Files",
     "## Safety Rules",
     "## Response Style",
     "## Error Handling",
-}
+})
 
 
 def _build_agents_slim(workspace_dir: Path | None = None) -> str:
@@ -235,42 +341,73 @@ def _build_agents_slim(workspace_dir: Path | None = None) -> str:
     if not agents:
         return ""
 
-    # Split into sections by ## headings
-    kept: list[str] = []
-    capturing = False
-
-    for line in agents.splitlines():
-        if line.startswith("## "):
-            capturing = line.strip() in _LEADER_AGENTS_SECTIONS
-        if capturing:
-            kept.append(line)
-
-    return "\n".join(kept).strip() if kept else ""
+    return _keep_h2_sections(agents, _LEADER_AGENTS_SECTIONS)
+
+
+# Static tail of the member roster
+_ROSTER_FOOTER = "\n".join([
+    "## Delegation Rules",
+    "1. **Role first**: choose the member whose expertise matches the task",
+    "2. **Verify tools**: confirm the chosen member has the tools the task needs "
+    "(check the Tool Routing table above)",
+    "3. **Never guess**: if a task needs a Google tool (gmail, sheets, calendar, "
+    "drive), only delegate to a member that has it — do NOT send it to a member "
+    "who would need to use shell commands or python as a workaround",
+    "4. If no member fits, handle it yourself or suggest the user add a specialist",
+    "5. Synthesize member results into a single clear response — "
+    "do not pass member output through verbatim",
+    "6. If a member fails, escalate to another who can help. "
+    "Never just report the failure — always attempt a fix or workaround",
+    "7. **Tool requests**: When a member returns a message starting with "
+    "'TOOL_REQUEST:', act based on the status field:",
+    "   - **enabled_not_assigned** → call "
+    "assign_tool_to_member(tool_name, member_name) immediately, "
+    "then re-delegate the original task",
+    "   - **not_enabled** → ask the user: 'Member X needs {tool_name} "
+    "to {reason}. Should I enable it?' If yes, call enable_tool() "
+    "then assign_tool_to_member(), then re-delegate",
+    "   - **not_found** → tell the user the tool doesn't exist in the "
+    "catalog. Suggest creating a custom one with "
+    "`vandelay tools create <name>` or delegate to the Vandelay Expert "
+    "to build it",
+    "",
+    "## When to Delegate to Vandelay Expert",
+    "Delegate to the Vandelay Expert whenever the user:",
+    "- Asks to create, modify, or improve an agent or team member",
+    "- Asks about which tools to enable or assign to an agent",
+    "- Wants to understand how Vandelay or Agno works",
+    "- Reports that an agent isn't performing well or behaving as expected",
+    "- Asks about prompt engineering, agent design, or best practices",
+    "- Wants to add a new specialist to the team",
+    "- Asks questions like 'how do I make X better?' about any agent",
+    "The Vandelay Expert is the authority on agent creation and platform capabilities. "
+    "Do NOT try to handle these yourself — delegate.",
+])
 
 
 def _build_member_roster(settings: Settings) -> str:
     """Generate a markdown roster of team members from config."""
-    from vandelay.agents.factory import _resolve_member
-    from vandelay.tools.registry import ToolRegistry
+    from vandelay.agents.factory import _list_member_files, _resolve_member
 
     members = settings.team.members
     if not members:
         return ""
 
     # Load tool descriptions for the routing table
-    registry = ToolRegistry()
+    tools = get_registry().tools
     tool_descs: dict[str, str] = {}
-    for entries in registry.by_category().values():
-        for entry in entries:
-            if entry.name in settings.enabled_tools:
-                # Short label: first method description or category
-                desc = entry.description or ""
-                # Extract first method summary if description starts with "Methods:"
-                if desc.startswith("Methods:"):
-                    first = desc.split(";")[0].replace("Methods: ", "")
-                    tool_descs[entry.name] = first.strip()
-                else:
-                    tool_descs[entry.name] = desc[:80] if desc else entry.category
+    for name in frozenset(settings.enabled_tools):
+        entry = tools.get(name)
+        if entry is None:
+            continue
+        # Short label: first method description or category
+        desc = entry.description or ""
+        # Extract first method summary if description starts with "Methods:"
+        if desc.startswith("Methods:"):
+            first = desc.partition(";")[0].removeprefix("Methods: ")
+            tool_descs[name] = first.strip()
+        else:
+            tool_descs[name] = desc[:80] if desc else entry.category
 
     lines: list[str] = [
         "# Your Team",
@@ -280,9 +417,12 @@ def _build_member_roster(settings: Settings) -> str:
         "",
     ]
 
+    # Resolve once; both the member table and the routing table read these
+    member_files = _list_member_files()
+    resolved = [_resolve_member(entry, member_files) for entry in members]
+
     # Member table with tool descriptions
-    for entry in members:
-        mc = _resolve_member(entry)
+    for mc in resolved:
         name = mc.name
         role = mc.role or "(no role)"
         model_str = (
@@ -303,20 +443,16 @@ def _build_member_roster(settings: Settings) -> str:
 
     # Build tool routing table: capability → member(s)
     tool_to_members: dict[str, list[str]] = {}
-    for entry in members:
-        mc = _resolve_member(entry)
+    for mc in resolved:
         for t in mc.tools:
             tool_to_members.setdefault(t, []).append(mc.name)
 
     # Group by category for cleaner routing
     cat_routing: dict[str, dict[str, list[str]]] = {}
-    for entries in registry.by_category().values():
-        for entry in entries:
-            if entry.name in tool_to_members:
-                cat = entry.category or "other"
-                cat_routing.setdefault(cat, {})[entry.name] = tool_to_members[
-                    entry.name
-                ]
+    for tool_name, holders in tool_to_members.items():
+        entry = tools.get(tool_name)
+        if entry is not None:
+            cat_routing.setdefault(entry.category or "other", {})[tool_name] = holders
 
     if cat_routing:
         lines.extend([
@@ -334,48 +470,29 @@ def _build_member_roster(settings: Settings) -> str:
                 lines.append(f"| {tool_name} | {cat} | {member_names} |")
         lines.append("")
 
-    lines.extend([
-        "## Delegation Rules",
-        "1. **Role first**: choose the member whose expertise matches the task",
-        "2. **Verify tools**: confirm the chosen member has the tools the task needs "
-        "(check the Tool Routing table above)",
-        "3. **Never guess**: if a task needs a Google tool (gmail, sheets, calendar, "
-        "drive), only delegate to a member that has it — do NOT send it to a member "
-        "who would need to use shell commands or python as a workaround",
-        "4. If no member fits, handle it yourself or suggest the user add a specialist",
-        "5. Synthesize member results into a single clear response — "
-        "do not pass member output through verbatim",
-        "6. If a member fails, escalate to another who can help. "
-        "Never just report the failure — always attempt a fix or workaround",
-        "7. **Tool requests**: When a member returns a message starting with "
-        "'TOOL_REQUEST:', act based on the status field:",
-        "   - **enabled_not_assigned** → call "
-        "assign_tool_to_member(tool_name, member_name) immediately, "
-        "then re-delegate the original task",
-        "   - **not_enabled** → ask the user: 'Member X needs {tool_name} "
-        "to {reason}. Should I enable it?' If yes, call enable_tool() "
-        "then assign_tool_to_member(), then re-delegate",
-        "   - **not_found** → tell the user the tool doesn't exist in the "
-        "catalog. Suggest creating a custom one with "
-        "`vandelay tools create <name>` or delegate to the Vandelay Expert "
-        "to build it",
-        "",
-        "## When to Delegate to Vandelay Expert",
-        "Delegate to the Vandelay Expert whenever the user:",
-        "- Asks to create, modify, or improve an agent or team member",
-        "- Asks about which tools to enable or assign to an agent",
-        "- Wants to understand how Vandelay or Agno works",
-        "- Reports that an agent isn't performing well or behaving as expected",
-        "- Asks about prompt engineering, agent design, or best practices",
-        "- Wants to add a new specialist to the team",
-        "- Asks questions like 'how do I make X better?' about any agent",
-        "The Vandelay Expert is the authority on agent creation and platform capabilities. "
-        "Do NOT try to handle these yourself — delegate.",
-    ])
+    lines.append(_ROSTER_FOOTER)
 
     return "\n".join(lines)
 
 
+# "When to Use" guidance per deep_work.activation mode
+_DEEP_WORK_ACTIVATION = {
+    "suggest": (
+        "When you detect a complex request that would benefit from extended "
+        "autonomous work (multi-step research, large implementations, etc.), "
+        "suggest using deep work to the user. Wait for their confirmation."
+    ),
+    "explicit": (
+        "Only use deep work when the user explicitly asks for it. "
+        "Do not suggest it proactively."
+    ),
+    "auto": (
+        "Automatically start deep work for complex requests without asking. "
+        "Use your judgment to determine when a task warrants deep work."
+    ),
+}
+
+
 def _build_deep_work_prompt(settings: Settings) -> str:
     """Generate a deep work section for the team leader prompt.
 
@@ -385,22 +502,6 @@ def _build_deep_work_prompt(settings: Settings) -> str:
     if not cfg.enabled:
         return ""
 
-    activation_desc = {
-        "suggest": (
-            "When you detect a complex request that would benefit from extended "
-            "autonomous work (multi-step research, large implementations, etc.), "
-            "suggest using deep work to the user. Wait for their confirmation."
-        ),
-        "explicit": (
-            "Only use deep work when the user explicitly asks for it. "
-            "Do not suggest it proactively."
-        ),
-        "auto": (
-            "Automatically start deep work for complex requests without asking. "
-            "Use your judgment to determine when a task warrants deep work."
-        ),
-    }
-
     lines = [
         "# Deep Work",
         "",
@@ -410,7 +511,7 @@ def _build_deep_work_prompt(settings: Settings) -> str:
         "specialists, and iterating until done.",
         "",
         "## When to Use",
-        activation_desc.get(cfg.activation, activation_desc["suggest"]),
+        _DEEP_WORK_ACTIVATION.get(cfg.activation, _DEEP_WORK_ACTIVATION["suggest"]),
         "",
         "Good candidates for deep work:",
         "- Research projects requiring multiple searches and synthesis",
@@ -449,14 +550,11 @@ def build_team_leader_prompt(
     - Uses a slim AGENTS.md (workspace, safety, style only — no delegation)
     - Adds a dynamic member roster so the leader knows when to delegate
     """
-    sections: list[str] = []
+    return _assemble_prompt("leader", agent_name, workspace_dir, settings, _build_leader_body)
 
-    # Agent identity preamble + current date/time so the agent never
-    # falls back to its training-cutoff date for scheduling tasks.
-    from datetime import datetime
 
-    now = datetime.now().strftime("%A, %B %d, %Y %I:%M %p")
-    sections.append(f"Your name is **{agent_name}**.\n\nCurrent date and time: {now}")
+def _build_leader_body(workspace_dir: Path | None, settings: Settings | None) -> list[str]:
+    sections: list[str] = []
 
     soul = get_template_content("SOUL.md", workspace_dir)
     if soul:
@@ -494,12 +592,4 @@ def build_team_leader_prompt(
     if heartbeat:
         sections.append(heartbeat)
 
-    # Bootstrap — same logic as standalone prompt (read once, auto-delete)
-    if workspace_dir:
-        bootstrap_path = workspace_dir / "BOOTSTRAP.md"
-        if bootstrap_path.exists():
-            sections.append(bootstrap_path.read_text(encoding="utf-8"))
-            with contextlib.suppress(OSError):
-                bootstrap_path.unlink()
-
-    return "\n\n---\n\n".join(sections)
+    return sections
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from importlib import resources
 from pathlib import Path
+from types import MappingProxyType
 
 
 @dataclass(frozen=True)
@@ -21,7 +23,7 @@ class StarterTemplate:
         return f"{self.slug}.md"
 
 
-STARTER_TEMPLATES: dict[str, StarterTemplate] = {
+STARTER_TEMPLATES: Mapping[str, StarterTemplate] = MappingProxyType({
     t.slug: t
     for t in [
         StarterTemplate(
@@ -109,7 +111,12 @@ STARTER_TEMPLATES: dict[str, StarterTemplate] = {
             suggested_tools=["notion", "googlesheets", "linear", "jira", "gmail", "camoufox"],
         ),
     ]
-}
+})
+
+# Sorted once; the member pickers call list_templates() on every render.
+_SORTED_TEMPLATES: tuple[StarterTemplate, ...] = tuple(
+    sorted(STARTER_TEMPLATES.values(), key=lambda t: t.name)
+)
 
 
 def get_template_content(slug: str) -> str:
@@ -124,4 +131,4 @@ def get_template_content(slug: str) -> str:
 
 def list_templates() -> list[StarterTemplate]:
     """Return all starter templates sorted by name."""
-    return sorted(STARTER_TEMPLATES.values(), key=lambda t: t.name)
+    return list(_SORTED_TEMPLATES)
@@ -2,10 +2,30 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Iterator
 from pathlib import Path
 
 from vandelay.config.constants import VANDELAY_HOME
 
+# One ``KEY=value`` assignment per line. Blank lines, ``#`` comments and lines
+# without ``=`` never match, so the whole file is scanned in a single pass.
+_ENV_LINE_RE = re.compile(r"^[^\S\n]*([^#\s=][^=\n]*?)[^\S\n]*=(.*)$", re.MULTILINE)
+
+# Every line boundary str.splitlines() recognises other than ``\n`` (CRLF, a
+# lone ``\r``, form feeds, ...), folded to ``\n`` before matching.
+_LINE_BREAK_RE = re.compile(r"\r\n?|[\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+
+def iter_env_pairs(text: str) -> Iterator[tuple[str, str]]:
+    """Yield ``(key, value)`` pairs from .env *text* in file order.
+
+    Inline comments (``VALUE=foo  # comment``) and surrounding whitespace are
+    stripped from values.
+    """
+    for match in _ENV_LINE_RE.finditer(_LINE_BREAK_RE.sub("\n", text)):
+        yield match.group(1), match.group(2).partition(" #")[0].strip()
+
 
 def write_env_key(env_key: str, value: str, env_path: Path | None = None) -> None:
     """Write or update a key in the .env file.
@@ -55,15 +75,8 @@ def read_env_file(env_path: Path | None = None) -> dict[str, str]:
         return result
 
     try:
-        for line in env_path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line or line.startswith("#") or "=" not in line:
-                continue
-            k, _, v = line.partition("=")
-            k = k.strip()
-            if " #" in v:
-                v = v[: v.index(" #")]
-            result[k] = v.strip()
+        raw = env_path.read_bytes().decode("utf-8", errors="replace")
+        result.update(iter_env_pairs(raw))
     except OSError:
         pass
 
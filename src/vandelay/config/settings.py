@@ -171,6 +171,11 @@ class Settings(BaseSettings):
         if changed:
             values["server"] = server
 
+    @property
+    def workspace_path(self) -> Path:
+        """``workspace_dir`` as a Path (shared instance per distinct string)."""
+        return _as_path(self.workspace_dir)
+
     @property
     def db_path(self) -> Path:
         """Resolved database path."""
@@ -194,6 +199,13 @@ class Settings(BaseSettings):
         return CONFIG_FILE.exists()
 
 
+# workspace_dir is reassigned by the TUI config editor, so the Path is keyed on
+# the string rather than cached on the Settings instance.
+@lru_cache(maxsize=8)
+def _as_path(value: str) -> Path:
+    return Path(value)
+
+
 @lru_cache
 def get_settings() -> Settings:
     """Singleton settings instance."""
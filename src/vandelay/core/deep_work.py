@@ -9,7 +9,6 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -256,7 +255,7 @@ class DeepWorkManager:
 
         from vandelay.agents.prompts.system_prompt import build_personality_brief
 
-        personality_brief = build_personality_brief(Path(settings.workspace_dir))
+        personality_brief = build_personality_brief(settings.workspace_path)
 
         # Build members from config
         members = []
@@ -374,7 +373,7 @@ class DeepWorkManager:
 
     def _save_to_workspace(self, session: DeepWorkSession) -> None:
         """Append session results to workspace MEMORY.md."""
-        workspace_dir = Path(self._settings.workspace_dir)
+        workspace_dir = self._settings.workspace_path
         memory_path = workspace_dir / "MEMORY.md"
 
         entry = (
@@ -11,6 +11,31 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Env vars each provider falls back to when knowledge.embedder.api_key is unset
+_PROVIDER_KEY_ENV = {
+    "openai": "OPENAI_API_KEY",
+    "google": "GOOGLE_API_KEY",
+    "openrouter": "OPENAI_API_KEY",
+}
+
+# Embedders per embedder_signature(). Building one can load a local model
+# (fastembed) or open an API client, so hot reloads with unchanged embedder
+# settings reuse the existing instance.
+_embedder_cache: dict[tuple, Any] = {}
+
+
+def embedder_signature(settings: Settings) -> tuple:
+    """Return a hashable key for everything that shapes the built embedder.
+
+    Covers the effective provider, the full embedder config (model,
+    base_url, ...) and the resolved API key, which the config dump excludes.
+    """
+    ecfg = settings.knowledge.embedder
+    provider = ecfg.provider or settings.model.provider
+    env_var = _PROVIDER_KEY_ENV.get(provider)
+    api_key = ecfg.api_key or (os.environ.get(env_var, "") if env_var else "")
+    return provider, ecfg.model_dump_json(), api_key
+
 
 def create_embedder(settings: Settings) -> Any | None:
     """Create an Agno embedder based on settings.
@@ -24,9 +49,12 @@ def create_embedder(settings: Settings) -> Any | None:
     Returns:
         An Agno Embedder instance, or ``None`` if unavailable.
     """
-    ecfg = settings.knowledge.embedder
-    provider = ecfg.provider or settings.model.provider
+    signature = embedder_signature(settings)
+    cached = _embedder_cache.get(signature)
+    if cached is not None:
+        return cached
 
+    provider = signature[0]
     builder = _EMBEDDER_BUILDERS.get(provider)
     if builder is None:
         # Provider has no embedder (e.g. anthropic) — try fastembed as fallback
@@ -34,9 +62,12 @@ def create_embedder(settings: Settings) -> Any | None:
             "No native embedder for provider '%s'. Trying local fastembed fallback.",
             provider,
         )
-        return _build_fastembed(settings)
+        builder = _build_fastembed
 
-    return builder(settings)
+    embedder = builder(settings)
+    if embedder is not None:
+        _embedder_cache[signature] = embedder
+    return embedder
 
 
 # ---------------------------------------------------------------------------
@@ -3,21 +3,28 @@
 from __future__ import annotations
 
 import logging
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from vandelay.knowledge.embedder import create_embedder
+from vandelay.knowledge.embedder import create_embedder, embedder_signature
 
 if TYPE_CHECKING:
     from vandelay.config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Knowledge instances per collection, embedder signature and contents db,
+# mirroring the db cache in vandelay.memory.setup. Hot reloads otherwise
+# reopen every vector store client. The signature covers the full embedder
+# config (so a new base_url or model rebuilds) plus the resolved API key. The
+# contents db is held in the value so its id() in the key stays valid.
+_knowledge_cache: dict[tuple, tuple[Any, Any]] = {}
+
 
 def create_knowledge(
     settings: Settings,
     db: Any = None,
     member_name: str | None = None,
+    embedder: Any = None,
 ) -> Any | None:
     """Build a Knowledge instance from settings.
 
@@ -27,6 +34,8 @@ def create_knowledge(
         member_name: When provided, creates an isolated per-member collection
             named ``vandelay_knowledge_<member_name>``. When ``None``, uses the
             shared ``vandelay_knowledge`` collection.
+        embedder: Pre-built embedder to reuse. When ``None``, one is created
+            from settings via ``create_embedder``.
 
     Returns ``None`` when knowledge is disabled or no embedder is available.
     The caller should pass ``None`` safely — the Agent works fine without it.
@@ -34,16 +43,6 @@ def create_knowledge(
     if not settings.knowledge.enabled:
         return None
 
-    embedder = create_embedder(settings)
-    if embedder is None:
-        return None
-
-    try:
-        from agno.knowledge.knowledge import Knowledge
-    except ImportError:
-        logger.warning("agno knowledge package not available.")
-        return None
-
     from vandelay.knowledge.vectordb import create_vector_db
 
     if member_name:
@@ -54,16 +53,36 @@ def create_knowledge(
         collection_name = "vandelay_knowledge"
         knowledge_name = "vandelay-knowledge"
 
-    vector_db = create_vector_db(embedder, collection_name=collection_name)
-    if vector_db is None:
+    # Checked before any embedder is built, so an unchanged config costs
+    # nothing on reload
+    cache_key = (collection_name, embedder_signature(settings), id(db))
+    cached = _knowledge_cache.get(cache_key)
+    if cached is not None:
+        return cached[1]
+
+    if embedder is None:
+        embedder = create_embedder(settings)
+    if embedder is None:
+        return None
+
+    try:
+        from agno.knowledge.knowledge import Knowledge
+    except ImportError:
+        logger.warning("agno knowledge package not available.")
         return None
 
     # Ensure knowledge directory exists
-    knowledge_dir = Path(settings.workspace_dir) / "knowledge"
+    knowledge_dir = settings.workspace_path / "knowledge"
     knowledge_dir.mkdir(parents=True, exist_ok=True)
 
-    return Knowledge(
+    vector_db = create_vector_db(embedder, collection_name=collection_name)
+    if vector_db is None:
+        return None
+
+    knowledge = Knowledge(
         name=knowledge_name,
         vector_db=vector_db,
         contents_db=db,
     )
+    _knowledge_cache[cache_key] = (db, knowledge)
+    return knowledge
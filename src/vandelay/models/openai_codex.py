@@ -9,11 +9,16 @@ Agno expects a Model, including as the main agent model or a team member model.
 
 from __future__ import annotations
 
+import atexit
 import base64
 import json
 import logging
+import os
+import stat
+import tempfile
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from agno.models.base import Model
@@ -43,9 +48,34 @@ def _decode_jwt_payload(token: str) -> dict:
         return {}
 
 
-def _extract_account_id(access_token: str) -> str:
-    payload = _decode_jwt_payload(access_token)
-    return payload.get(_JWT_AUTH_CLAIM, {}).get("chatgpt_account_id", "")
+# ((mtime_ns, size), access_token, account_id, exp) from the last successful
+# load. Each model instance calls load_codex_credentials() on first use, so a
+# team of codex members would otherwise re-read auth.json and re-decode the JWT
+# per member. Keyed on auth.json's stat like factory._env_stamp, so a logout,
+# re-login or account switch is picked up on the next call.
+_CODEX_CACHE: tuple[tuple[int, int], str, str, float] | None = None
+
+
+def _invalidate_codex_cache() -> None:
+    global _CODEX_CACHE
+    _CODEX_CACHE = None
+
+
+@lru_cache(maxsize=1)
+def _http_client() -> Any:
+    """Shared httpx client for token refreshes and non-streaming requests.
+
+    Reusing one client keeps TCP/TLS connections pooled instead of
+    handshaking on every call.
+    """
+    try:
+        import httpx
+    except ImportError as exc:
+        raise ImportError("httpx is required for Codex requests: uv add httpx") from exc
+
+    client = httpx.Client(timeout=120)
+    atexit.register(client.close)
+    return client
 
 
 def load_codex_credentials() -> tuple[str, str] | None:
@@ -54,17 +84,28 @@ def load_codex_credentials() -> tuple[str, str] | None:
     Auto-refreshes using the stored refresh_token when the access token is
     within 5 minutes of expiry. Returns None if credentials are missing.
     """
-    import urllib.parse
-    import urllib.request
+    global _CODEX_CACHE
     from pathlib import Path
 
     auth_path = Path.home() / ".codex" / "auth.json"
-    if not auth_path.exists():
-        logger.warning("~/.codex/auth.json not found — run `codex login` first")
-        return None
+    try:
+        st = auth_path.stat()
+    except OSError:
+        st = None
+    if (
+        st is not None
+        and _CODEX_CACHE is not None
+        and _CODEX_CACHE[0] == (st.st_mtime_ns, st.st_size)
+        and _CODEX_CACHE[3] - time.time() >= 300
+    ):
+        return _CODEX_CACHE[1], _CODEX_CACHE[2]
 
     try:
-        auth = json.loads(auth_path.read_text(encoding="utf-8"))
+        # json.loads detects UTF-8 from bytes, so skip the separate decode
+        auth = json.loads(auth_path.read_bytes())
+    except FileNotFoundError:
+        logger.warning("~/.codex/auth.json not found — run `codex login` first")
+        return None
     except Exception as exc:
         logger.warning("Failed to read ~/.codex/auth.json: %s", exc)
         return None
@@ -81,33 +122,58 @@ def load_codex_credentials() -> tuple[str, str] | None:
         payload = _decode_jwt_payload(access_token)
         exp = payload.get("exp", 0)
         if exp - time.time() < 300 and refresh_token:
-            body = urllib.parse.urlencode({
-                "grant_type": "refresh_token",
-                "refresh_token": refresh_token,
-                "client_id": CODEX_CLIENT_ID,
-            }).encode()
-            req = urllib.request.Request(
+            resp = _http_client().post(
                 "https://auth.openai.com/oauth/token",
-                data=body,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-                method="POST",
+                data={
+                    "grant_type": "refresh_token",
+                    "refresh_token": refresh_token,
+                    "client_id": CODEX_CLIENT_ID,
+                },
+                timeout=10,
             )
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                new_tokens = json.loads(resp.read())
-            access_token = new_tokens.get("access_token", access_token)
-            tokens["access_token"] = access_token
-            tokens["refresh_token"] = new_tokens.get("refresh_token", refresh_token)
-            auth["tokens"] = tokens
-            from datetime import datetime, timezone
-            auth["last_refresh"] = datetime.now(timezone.utc).isoformat()
-            auth_path.write_text(json.dumps(auth, indent=2), encoding="utf-8")
-            logger.debug("Codex token refreshed and saved")
+            resp.raise_for_status()
+            new_tokens = resp.json()
+            new_access = new_tokens.get("access_token", access_token)
+            new_refresh = new_tokens.get("refresh_token", refresh_token)
+            # Nothing to persist if the endpoint handed back the same tokens
+            if (new_access, new_refresh) != (access_token, refresh_token):
+                access_token = new_access
+                tokens["access_token"] = new_access
+                tokens["refresh_token"] = new_refresh
+                auth["tokens"] = tokens
+                from datetime import datetime, timezone
+                auth["last_refresh"] = datetime.now(timezone.utc).isoformat()
+                # Write a unique temp file then replace so the codex CLI never
+                # reads a half-written file. mkstemp creates it 0600; carry
+                # over auth.json's own mode so the tokens never widen.
+                mode = stat.S_IMODE(auth_path.stat().st_mode)
+                fd, tmp_name = tempfile.mkstemp(
+                    dir=auth_path.parent, prefix=".auth.", suffix=".tmp",
+                )
+                try:
+                    os.chmod(tmp_name, mode)
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        f.write(json.dumps(auth, indent=2))
+                    os.replace(tmp_name, auth_path)
+                except BaseException:
+                    Path(tmp_name).unlink(missing_ok=True)
+                    raise
+                logger.debug("Codex token refreshed and saved")
     except Exception as exc:
         logger.debug("Token refresh attempt failed (using existing): %s", exc)
 
-    account_id = _extract_account_id(access_token)
+    payload = _decode_jwt_payload(access_token)
+    account_id = payload.get(_JWT_AUTH_CLAIM, {}).get("chatgpt_account_id", "")
     if not account_id:
         logger.warning("Could not extract chatgpt_account_id from JWT — requests may fail")
+    else:
+        try:
+            # Re-stat: a refresh above may have rewritten the file
+            st = auth_path.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+            _CODEX_CACHE = (stamp, access_token, account_id, float(payload.get("exp", 0)))
+        except OSError:
+            _CODEX_CACHE = None
 
     return access_token, account_id
 
@@ -363,13 +429,10 @@ class CodexModel(Model):
         return body
 
     def _sync_post(self, headers: dict, body: dict) -> bytes:
-        import urllib.request
-
         url = f"{self.base_url}/codex/responses"
-        data = json.dumps(body).encode()
-        req = urllib.request.Request(url, data=data, headers=headers, method="POST")
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            return resp.read()
+        resp = _http_client().post(url, headers=headers, content=json.dumps(body).encode())
+        resp.raise_for_status()
+        return resp.content
 
     async def _async_post(self, headers: dict, body: dict) -> bytes:
         try:
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import io
 import subprocess
+import sys
+import threading
+from contextlib import contextmanager
 from functools import wraps
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from vandelay.tools.registry import ToolEntry, ToolRegistry
+from vandelay.tools.registry import ToolEntry, ToolRegistry, get_registry
 
 
 def _find_project_root() -> str | None:
@@ -21,6 +25,38 @@ def _find_project_root() -> str | None:
 if TYPE_CHECKING:
     from vandelay.config.settings import Settings
 
+# Guards the process-wide steps of instantiate_tools: auto-installing deps,
+# loading custom tool modules into sys.modules, and Google tools sharing one
+# token file. Plain toolkit construction runs outside it, so concurrently
+# built team members construct their tools in parallel.
+_shared_state_lock = threading.Lock()
+
+# Reference-counted stdout/stderr silencing for toolkit constructors. The
+# first thread in swaps the streams and the last one out restores them, so
+# overlapping constructors never restore each other's StringIO.
+_quiet_lock = threading.Lock()
+_quiet_depth = 0
+_saved_streams: tuple[Any, Any] | None = None
+
+
+@contextmanager
+def _quiet_stdio():
+    global _quiet_depth, _saved_streams
+    with _quiet_lock:
+        if _quiet_depth == 0:
+            _saved_streams = (sys.stdout, sys.stderr)
+            sys.stdout = io.StringIO()
+            sys.stderr = io.StringIO()
+        _quiet_depth += 1
+    try:
+        yield
+    finally:
+        with _quiet_lock:
+            _quiet_depth -= 1
+            if _quiet_depth == 0:
+                sys.stdout, sys.stderr = _saved_streams  # type: ignore[misc]
+                _saved_streams = None
+
 
 def _google_all_scopes() -> list[str]:
     """All OAuth scopes needed across Google tools."""
@@ -258,7 +294,7 @@ class ToolManager:
     """High-level tool operations: enable, disable, install, instantiate."""
 
     def __init__(self, registry: ToolRegistry | None = None) -> None:
-        self._registry = registry or ToolRegistry()
+        self._registry = registry or get_registry()
 
     @property
     def registry(self) -> ToolRegistry:
@@ -374,11 +410,13 @@ class ToolManager:
             return InstallResult(False, "Uninstall timed out after 120s.", tool_name)
 
     def instantiate_tools(self, enabled_tools: list[str], settings: Settings | None = None) -> list:
-        """Create Toolkit instances for all enabled tools. Returns list of Agno Toolkit objects."""
+        """Create Toolkit instances for all enabled tools. Returns list of Agno Toolkit objects.
+
+        Safe to call from several threads at once; only the steps that touch
+        process-wide state take ``_shared_state_lock``.
+        """
         import importlib
-        import io
         import logging
-        import sys
 
         logger = logging.getLogger("vandelay.tools")
         instances = []
@@ -433,49 +471,52 @@ class ToolManager:
                     "googlesheets": {"token_path": None, "oauth_port": 0},
                 }
                 if tool_name in _goauth:
-                    from vandelay.config.constants import VANDELAY_HOME
-                    mod = importlib.import_module(entry.module_path)
-                    cls = getattr(mod, entry.class_name)
-                    kwargs = dict(_goauth[tool_name])
-                    token = str(VANDELAY_HOME / "google_token.json")
-                    # Set token_path (key name varies per tool)
-                    for k in kwargs:
-                        if "token" in k:
-                            kwargs[k] = token
-                            break
-                    # Pass all scopes to every Google tool so scope
-                    # validation works and refreshes keep all scopes.
-                    kwargs["scopes"] = _google_all_scopes()
-                    if tool_name == "googlecalendar":
-                        from vandelay.config.settings import get_settings
-                        _settings = get_settings()
-                        kwargs["calendar_id"] = _settings.google.calendar_id
-                        kwargs["allow_update"] = True
-                    instance = cls(**kwargs)
-                    _inject_google_creds(instance, token)
-                    if tool_name == "googlesheets":
-                        _cap_sheet_output(instance)
-                    if tool_name == "gmail":
-                        _fix_gmail_html_body(instance)
-                    instances.append(instance)
+                    # Shared token file: refreshes must not interleave
+                    with _shared_state_lock:
+                        from vandelay.config.constants import VANDELAY_HOME
+                        mod = importlib.import_module(entry.module_path)
+                        cls = getattr(mod, entry.class_name)
+                        kwargs = dict(_goauth[tool_name])
+                        token = str(VANDELAY_HOME / "google_token.json")
+                        # Set token_path (key name varies per tool)
+                        for k in kwargs:
+                            if "token" in k:
+                                kwargs[k] = token
+                                break
+                        # Pass all scopes to every Google tool so scope
+                        # validation works and refreshes keep all scopes.
+                        kwargs["scopes"] = _google_all_scopes()
+                        if tool_name == "googlecalendar":
+                            from vandelay.config.settings import get_settings
+                            _settings = get_settings()
+                            kwargs["calendar_id"] = _settings.google.calendar_id
+                            kwargs["allow_update"] = True
+                        instance = cls(**kwargs)
+                        _inject_google_creds(instance, token)
+                        if tool_name == "googlesheets":
+                            _cap_sheet_output(instance)
+                        if tool_name == "gmail":
+                            _fix_gmail_html_body(instance)
+                        instances.append(instance)
                     continue
 
                 # Custom tools: load from file path via importlib.util
                 if entry.module_path.startswith("vandelay_custom_"):
-                    loaded_mod = sys.modules.get(entry.module_path)
-                    if loaded_mod is None:
-                        import importlib.util as ilu
-
-                        from vandelay.config.constants import CUSTOM_TOOLS_DIR
-
-                        file_path = CUSTOM_TOOLS_DIR / f"{entry.name}.py"
-                        spec = ilu.spec_from_file_location(
-                            entry.module_path, file_path,
-                        )
-                        if spec and spec.loader:
-                            loaded_mod = ilu.module_from_spec(spec)
-                            sys.modules[entry.module_path] = loaded_mod
-                            spec.loader.exec_module(loaded_mod)
+                    with _shared_state_lock:
+                        loaded_mod = sys.modules.get(entry.module_path)
+                        if loaded_mod is None:
+                            import importlib.util as ilu
+
+                            from vandelay.config.constants import CUSTOM_TOOLS_DIR
+
+                            file_path = CUSTOM_TOOLS_DIR / f"{entry.name}.py"
+                            spec = ilu.spec_from_file_location(
+                                entry.module_path, file_path,
+                            )
+                            if spec and spec.loader:
+                                loaded_mod = ilu.module_from_spec(spec)
+                                sys.modules[entry.module_path] = loaded_mod
+                                spec.loader.exec_module(loaded_mod)
                     if loaded_mod:
                         custom_cls = getattr(loaded_mod, entry.class_name)
                         instances.append(custom_cls())
@@ -484,28 +525,24 @@ class ToolManager:
                 # Auto-install deps for non-builtin tools that are enabled
                 # but whose packages aren't yet installed (e.g. after a fresh
                 # deploy or a manual config edit that bypassed enable_tool).
-                if not entry.is_builtin and not self._check_installed(entry):
-                    result = self.install_deps(tool_name)
-                    if not result.success:
-                        logger.warning(
-                            "Skipping tool %s: deps could not be installed: %s",
-                            tool_name, result.message,
-                        )
-                        continue
-                    logger.info("Auto-installed deps for tool '%s'", tool_name)
+                with _shared_state_lock:
+                    if not entry.is_builtin and not self._check_installed(entry):
+                        result = self.install_deps(tool_name)
+                        if not result.success:
+                            logger.warning(
+                                "Skipping tool %s: deps could not be installed: %s",
+                                tool_name, result.message,
+                            )
+                            continue
+                        logger.info("Auto-installed deps for tool '%s'", tool_name)
 
                 mod = importlib.import_module(entry.module_path)
                 cls = getattr(mod, entry.class_name)
 
                 # Suppress noisy stdout/stderr from Agno toolkit constructors
                 # (e.g. "newspaper4k not installed" prints before raising)
-                old_stdout, old_stderr = sys.stdout, sys.stderr
-                sys.stdout = io.StringIO()
-                sys.stderr = io.StringIO()
-                try:
+                with _quiet_stdio():
                     instances.append(cls())
-                finally:
-                    sys.stdout, sys.stderr = old_stdout, old_stderr
             except Exception as e:
                 # Skip tools that can't be loaded (missing deps, missing API keys, etc.)
                 logger.warning("Skipping tool %s: %s", tool_name, e)
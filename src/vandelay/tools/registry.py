@@ -5,6 +5,7 @@ from __future__ import annotations
 import importlib
 import json
 import pkgutil
+import threading
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -459,19 +460,30 @@ class ToolRegistry:
     def __init__(self, cache_path: Path | None = None) -> None:
         self._cache_path = cache_path or TOOL_REGISTRY_FILE
         self._cache: RegistryCache | None = None
+        # mtime of the cache file as of the last load/save, so long-lived
+        # instances can notice refreshes made by another ToolRegistry.
+        self._cache_mtime: float | None = None
+        # Serializes first load/discovery so concurrent readers (prompt
+        # building and tool setup run on separate threads) discover once.
+        self._load_lock = threading.RLock()
+
+    def _loaded(self) -> RegistryCache:
+        cache = self._cache
+        if cache is None:
+            with self._load_lock:
+                if self._cache is None:
+                    self._load_or_refresh()
+                cache = self._cache
+        return cache  # type: ignore[return-value]
 
     @property
     def tools(self) -> dict[str, ToolEntry]:
         """All known tools. Loads from cache if not yet in memory."""
-        if self._cache is None:
-            self._load_or_refresh()
-        return self._cache.tools  # type: ignore[union-attr]
+        return self._loaded().tools
 
     @property
     def refreshed_at(self) -> str:
-        if self._cache is None:
-            self._load_or_refresh()
-        return self._cache.refreshed_at  # type: ignore[union-attr]
+        return self._loaded().refreshed_at
 
     def _load_or_refresh(self) -> None:
         """Load from disk cache, or discover + cache if no cache exists."""
@@ -482,6 +494,7 @@ class ToolRegistry:
 
                 # Invalidate cache if custom tools dir has newer files
                 cache_mtime = self._cache_path.stat().st_mtime
+                self._cache_mtime = cache_mtime
                 if _custom_tools_changed(CUSTOM_TOOLS_DIR, cache_mtime):
                     self.refresh()
 
@@ -490,6 +503,23 @@ class ToolRegistry:
                 pass
         self.refresh()
 
+    def reload_if_stale(self) -> None:
+        """Drop the in-memory cache if the registry file or custom tools changed.
+
+        The next access re-reads (or re-discovers) the registry. Cheap enough
+        to call before every agent build: one stat plus a custom_tools scan.
+        """
+        if self._cache is None:
+            return
+        try:
+            mtime = self._cache_path.stat().st_mtime
+        except OSError:
+            mtime = None
+        if mtime != self._cache_mtime or (
+            mtime is not None and _custom_tools_changed(CUSTOM_TOOLS_DIR, mtime)
+        ):
+            self._cache = None
+
     def refresh(self) -> int:
         """Re-discover all tools from the installed agno package. Returns count."""
         tools: dict[str, ToolEntry] = {}
@@ -681,6 +711,7 @@ class ToolRegistry:
             json.dumps(self._cache.to_dict(), indent=2),
             encoding="utf-8",
         )
+        self._cache_mtime = self._cache_path.stat().st_mtime
 
     def get(self, name: str) -> ToolEntry | None:
         """Get a tool entry by name."""
@@ -704,3 +735,20 @@ class ToolRegistry:
     def builtin_tools(self) -> list[ToolEntry]:
         """Tools that need no extra pip install."""
         return [t for t in self.tools.values() if t.is_builtin]
+
+
+# Process-wide registry shared by ToolManager and the prompt builder, so a
+# cold start runs discovery and writes tool_registry.json only once.
+_shared_registry: ToolRegistry | None = None
+_shared_registry_lock = threading.Lock()
+
+
+def get_registry() -> ToolRegistry:
+    """Return the shared ToolRegistry, revalidating it against disk."""
+    global _shared_registry
+    with _shared_registry_lock:
+        if _shared_registry is None:
+            _shared_registry = ToolRegistry()
+        else:
+            _shared_registry.reload_if_stale()
+        return _shared_registry
@@ -37,10 +37,9 @@ class ToolRequestTools(Toolkit):
         Returns:
             str: A structured message for the leader to act on.
         """
-        from vandelay.tools.registry import ToolRegistry
+        from vandelay.tools.registry import get_registry
 
-        registry = ToolRegistry()
-        entry = registry.get(tool_name)
+        entry = get_registry().get(tool_name)
 
         # Check if this member already has the tool assigned
         for m in self._settings.team.members:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import shutil
+from functools import cache, lru_cache
 from pathlib import Path
 
 from vandelay.config.constants import KNOWLEDGE_DIR, MEMBERS_DIR, WORKSPACE_DIR
@@ -49,19 +50,35 @@ def get_template_content(name: str, workspace_dir: Path | None = None) -> str:
     If the user's file exists but is empty, the shipped template is used so
     that template updates propagate without requiring users to delete their file.
     """
-    ws = workspace_dir or WORKSPACE_DIR
-    user_file = ws / name
-    if user_file.exists():
-        content = user_file.read_text(encoding="utf-8")
-        if content.strip():
-            return content
-        # File exists but is empty — fall through to shipped template
-
-    default_file = _TEMPLATES_DIR / name
-    if default_file.exists():
-        return default_file.read_text(encoding="utf-8")
-
-    return ""
+    user_file = (workspace_dir or WORKSPACE_DIR) / name
+    try:
+        st = user_file.stat()
+    except FileNotFoundError:
+        content = ""
+    else:
+        content = _read_user_template(str(user_file), st.st_mtime_ns, st.st_size)
+    if content.strip():
+        return content
+    # Missing or empty — fall through to shipped template
+    return _shipped_template(name)
+
+
+@lru_cache(maxsize=32)
+def _read_user_template(path: str, mtime_ns: int, size: int) -> str:
+    """Read a workspace file; the stat stamp in the key invalidates edits."""
+    try:
+        return Path(path).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return ""
+
+
+@cache
+def _shipped_template(name: str) -> str:
+    """Shipped defaults are read-only package data, so read each one once."""
+    try:
+        return (_TEMPLATES_DIR / name).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return ""
 
 
 def workspace_is_initialized(workspace_dir: Path | None = None) -> bool:
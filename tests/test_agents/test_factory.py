@@ -10,6 +10,18 @@ from vandelay.config.models import KnowledgeConfig, MemberConfig, ModelConfig, T
 from vandelay.config.settings import Settings
 
 
+@pytest.fixture(autouse=True)
+def _fresh_model_caches():
+    """Model classes/instances are memoized; tests patch sys.modules per case."""
+    from vandelay.agents.factory import _build_model, _model_class
+
+    _build_model.cache_clear()
+    _model_class.cache_clear()
+    yield
+    _build_model.cache_clear()
+    _model_class.cache_clear()
+
+
 class TestGetModel:
     """Test _get_model for various providers."""
 
@@ -45,10 +57,71 @@ class TestGetModel:
             _get_model(settings)
 
 
+class TestModelBuilders:
+    """Provider dispatch table."""
+
+    def test_every_known_provider_has_builder(self):
+        from vandelay.agents.factory import _MODEL_BUILDERS
+        from vandelay.config.constants import MODEL_PROVIDERS
+
+        assert set(_MODEL_BUILDERS) == set(MODEL_PROVIDERS)
+
+    def test_model_class_resolved_once(self):
+        from vandelay.agents.factory import _model_class
+
+        with patch("vandelay.agents.factory.importlib.import_module") as mock_import:
+            mock_import.return_value = MagicMock(Groq="GroqCls")
+            assert _model_class("groq") == "GroqCls"
+            assert _model_class("groq") == "GroqCls"
+        mock_import.assert_called_once_with("agno.models.groq")
+
+    def test_openai_codex_auth_uses_codex_model(self):
+        from vandelay.agents.factory import _build_model
+
+        mock_cls = MagicMock(return_value=MagicMock())
+        with patch.dict(
+            "sys.modules",
+            {"vandelay.models.openai_codex": MagicMock(CodexModel=mock_cls)},
+        ):
+            _build_model.__wrapped__("openai", "gpt-5", "codex", None)
+        mock_cls.assert_called_once_with(id="gpt-5")
+
+
+class TestModelCache:
+    """Identical model configs share one instance; key changes rebuild it."""
+
+    def test_same_config_returns_same_instance(self):
+        from vandelay.agents.factory import _get_model_from_config
+
+        mock_cls = MagicMock(side_effect=lambda **kw: MagicMock())
+        with (
+            patch.dict("os.environ", {"GROQ_API_KEY": "gk-1"}),
+            patch.dict("sys.modules", {"agno.models.groq": MagicMock(Groq=mock_cls)}),
+        ):
+            first = _get_model_from_config("groq", "llama")
+            second = _get_model_from_config("groq", "llama")
+
+        assert first is second
+        mock_cls.assert_called_once_with(id="llama", api_key="gk-1")
+
+    def test_rotated_api_key_builds_new_instance(self):
+        from vandelay.agents.factory import _get_model_from_config
+
+        mock_cls = MagicMock(side_effect=lambda **kw: MagicMock())
+        with patch.dict("sys.modules", {"agno.models.groq": MagicMock(Groq=mock_cls)}):
+            with patch.dict("os.environ", {"GROQ_API_KEY": "gk-1"}):
+                first = _get_model_from_config("groq", "llama")
+            with patch.dict("os.environ", {"GROQ_API_KEY": "gk-2"}):
+                second = _get_model_from_config("groq", "llama")
+
+        assert first is not second
+        assert mock_cls.call_count == 2
+
+
 class TestKnowledgeWiring:
     """Test that knowledge is wired into create_agent."""
 
-    @patch("vandelay.knowledge.setup.create_knowledge")
+    @patch("vandelay.agents.factory.create_knowledge")
     @patch("vandelay.agents.factory.Agent")
     @patch("vandelay.agents.factory._get_model")
     @patch("vandelay.agents.factory._get_tools")
@@ -88,7 +161,7 @@ class TestKnowledgeWiring:
         assert call_kwargs["knowledge"] is mock_knowledge
         assert call_kwargs["search_knowledge"] is True
 
-    @patch("vandelay.knowledge.setup.create_knowledge")
+    @patch("vandelay.agents.factory.create_knowledge")
     @patch("vandelay.agents.factory.Agent")
     @patch("vandelay.agents.factory._get_model")
     @patch("vandelay.agents.factory._get_tools")
@@ -127,6 +200,63 @@ class TestKnowledgeWiring:
         assert call_kwargs["search_knowledge"] is False
 
 
+class TestParallelSetup:
+    """create_agent builds db/model/prompt on the init pool, tools inline."""
+
+    def test_executor_is_reused(self):
+        from vandelay.agents.factory import _get_init_executor
+
+        assert _get_init_executor() is _get_init_executor()
+
+    @patch("vandelay.agents.factory.create_knowledge", return_value=None)
+    @patch("vandelay.agents.factory.Agent")
+    @patch("vandelay.agents.factory._get_model")
+    @patch("vandelay.agents.factory._get_tools")
+    @patch("vandelay.agents.factory.create_db")
+    @patch("vandelay.agents.factory.build_system_prompt")
+    def test_tools_built_on_calling_thread(
+        self,
+        mock_prompt,
+        mock_db,
+        mock_tools,
+        mock_model,
+        mock_agent_cls,
+        mock_create_knowledge,
+        tmp_path,
+    ):
+        import threading
+
+        from vandelay.agents.factory import create_agent
+
+        threads: dict[str, str] = {}
+
+        def record(name, value):
+            def _inner(*args, **kwargs):
+                threads[name] = threading.current_thread().name
+                return value
+            return _inner
+
+        db, model = MagicMock(), MagicMock()
+        mock_db.side_effect = record("db", db)
+        mock_model.side_effect = record("model", model)
+        mock_prompt.side_effect = record("prompt", ["test instruction"])
+        mock_tools.side_effect = record("tools", [])
+
+        settings = Settings(
+            agent_name="TestAgent",
+            model=ModelConfig(provider="ollama"),
+            workspace_dir=str(tmp_path),
+        )
+        create_agent(settings)
+
+        call_kwargs = mock_agent_cls.call_args[1]
+        assert call_kwargs["db"] is db
+        assert call_kwargs["model"] is model
+        assert call_kwargs["instructions"] == ["test instruction"]
+        assert threads["tools"] == threading.current_thread().name
+        assert threads["db"].startswith("vandelay-init")
+
+
 class TestTeamConfigDefaults:
     """Verify TeamConfig ships with team mode on and vandelay-expert."""
 
@@ -161,6 +291,19 @@ class TestResolveMember:
         assert mc.tools == ["file", "python", "shell"]
         assert mc.instructions_file == "vandelay-expert.md"
 
+    def test_resolved_tools_do_not_alias_preset(self, tmp_path):
+        from vandelay.agents.factory import _PRESET_MEMBERS, _PRESET_TOOL_MAP, _resolve_member
+
+        with patch("vandelay.config.constants.MEMBERS_DIR", tmp_path / "members"):
+            mc = _resolve_member("vandelay-expert")
+        mc.tools.append("tavily")
+
+        assert _PRESET_TOOL_MAP["vandelay-expert"] == ("file", "python", "shell")
+        assert _PRESET_MEMBERS["vandelay-expert"].tools == ["file", "python", "shell"]
+        assert _PRESET_MEMBERS["vandelay-expert"].instructions_file == ""
+        with pytest.raises(TypeError):
+            _PRESET_TOOL_MAP["other"] = ()  # type: ignore[index]
+
     def test_resolve_member_config_passthrough(self):
         from vandelay.agents.factory import _resolve_member
 
@@ -199,6 +342,19 @@ class TestResolveMember:
         # Should NOT have overwritten
         assert existing.read_text(encoding="utf-8") == "custom content"
 
+    def test_ensure_template_uses_member_listing(self, tmp_path):
+        from vandelay.agents.factory import _ensure_template_instructions
+
+        members_dir = tmp_path / "members"
+        mc = MemberConfig(name="vandelay-expert", role="test", tools=["file"])
+
+        with patch("vandelay.config.constants.MEMBERS_DIR", members_dir):
+            result = _ensure_template_instructions(mc, frozenset({"vandelay-expert.md"}))
+
+        # The listing says the file exists, so nothing is written
+        assert result.instructions_file == "vandelay-expert.md"
+        assert not members_dir.exists()
+
     def test_ensure_template_no_template(self):
         from vandelay.agents.factory import _ensure_template_instructions
 
@@ -216,3 +372,53 @@ class TestResolveMember:
         )
         result = _ensure_template_instructions(mc)
         assert result.instructions_file == "custom.md"
+
+
+class TestLoadEnv:
+    """_load_env parses ~/.vandelay/.env once and re-parses only on change."""
+
+    @pytest.fixture
+    def env_home(self, tmp_path, monkeypatch):
+        import vandelay.agents.factory as factory
+        import vandelay.config.constants as consts
+
+        monkeypatch.setattr(consts, "VANDELAY_HOME", tmp_path)
+        monkeypatch.setattr(factory, "_env_stamp", None)
+        return tmp_path
+
+    def test_loads_keys_without_overwriting(self, env_home):
+        from vandelay.agents.factory import _load_env
+
+        (env_home / ".env").write_text(
+            "# comment\nVDL_TEST_A=alpha  # inline\nVDL_TEST_B=beta\n", encoding="utf-8",
+        )
+        with patch.dict("os.environ", {"VDL_TEST_B": "from-env"}):
+            import os
+
+            _load_env()
+            assert os.environ["VDL_TEST_A"] == "alpha"
+            assert os.environ["VDL_TEST_B"] == "from-env"
+
+    def test_unchanged_file_is_not_reread(self, env_home):
+        from pathlib import Path
+
+        from vandelay.agents.factory import _load_env
+
+        (env_home / ".env").write_text("VDL_TEST_A=alpha\n", encoding="utf-8")
+        with patch.dict("os.environ", {}):
+            _load_env()
+            with patch.object(Path, "read_bytes", side_effect=AssertionError("re-read")):
+                _load_env()
+
+    def test_edited_file_is_reloaded(self, env_home):
+        import os
+
+        from vandelay.agents.factory import _load_env
+
+        env_file = env_home / ".env"
+        env_file.write_text("VDL_TEST_A=alpha\n", encoding="utf-8")
+        with patch.dict("os.environ", {}):
+            _load_env()
+            env_file.write_text("VDL_TEST_A=alpha\nVDL_TEST_NEW=fresh\n", encoding="utf-8")
+            _load_env()
+            assert os.environ["VDL_TEST_NEW"] == "fresh"
@@ -100,6 +100,26 @@ class TestBuildMemberAgent:
         kwargs = mock_agent.call_args[1]
         assert kwargs["model"] is custom_model
 
+    @patch("vandelay.agents.factory.Agent")
+    def test_personality_brief_follows_tag(self, mock_agent):
+        from vandelay.agents.factory import _build_member_agent
+
+        mock_agent.return_value = MagicMock()
+        mc = MemberConfig(name="test", instructions=["Be brief."])
+
+        _build_member_agent(
+            mc,
+            main_model=MagicMock(),
+            db=MagicMock(),
+            knowledge=None,
+            settings=_make_settings(),
+            personality_brief="## Vibe\nDry wit.",
+        )
+
+        instructions = mock_agent.call_args[1]["instructions"]
+        assert instructions[1] == "## Vibe\nDry wit."
+        assert instructions[-1] == "Be brief."
+
     @patch("vandelay.agents.factory.Agent")
     def test_inherits_main_model_when_no_override(self, mock_agent):
         from vandelay.agents.factory import _build_member_agent
@@ -149,7 +169,7 @@ class TestBuildMemberAgent:
         # Only shell is enabled — file and tavily should be filtered out
         settings = _make_settings(enabled_tools=["shell"])
 
-        with patch("vandelay.tools.manager.ToolManager") as mock_mgr:
+        with patch("vandelay.agents.factory._get_tool_manager") as mock_mgr:
             mock_mgr.return_value.instantiate_tools.return_value = [MagicMock()]
             _build_member_agent(
                 mc,
@@ -198,6 +218,24 @@ class TestLoadInstructionsFile:
         result = _load_instructions_file(str(instructions_file))
         assert result == "Absolute instructions."
 
+    def test_cached_until_file_changes(self, tmp_path):
+        import os
+        from pathlib import Path
+
+        from vandelay.agents.factory import _load_instructions_file
+
+        instructions_file = tmp_path / "cached.md"
+        instructions_file.write_text("First.", encoding="utf-8")
+        assert _load_instructions_file(str(instructions_file)) == "First."
+
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            assert _load_instructions_file(str(instructions_file)) == "First."
+
+        instructions_file.write_text("Second.", encoding="utf-8")
+        st = instructions_file.stat()
+        os.utime(instructions_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert _load_instructions_file(str(instructions_file)) == "Second."
+
     @patch("vandelay.agents.factory.Agent")
     def test_file_merged_with_inline_instructions(self, mock_agent, tmp_path):
         from vandelay.agents.factory import _build_member_agent
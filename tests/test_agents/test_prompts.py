@@ -130,6 +130,53 @@ def test_build_prompt_excludes_bootstrap_after_removal(tmp_workspace):
     assert "Bootstrap" not in prompt
 
 
+def test_build_prompt_ignores_bootstrap_directory(tmp_workspace):
+    """A directory named BOOTSTRAP.md is skipped rather than crashing the build."""
+    bootstrap = tmp_workspace / "BOOTSTRAP.md"
+    bootstrap.unlink()
+    bootstrap.mkdir()
+    prompt = build_system_prompt(workspace_dir=tmp_workspace)
+    assert "Bootstrap" not in prompt
+    assert bootstrap.is_dir()
+
+
+def test_prompt_body_reused_until_inputs_change(tmp_workspace, prompt_settings):
+    """Unchanged inputs reuse the cached body; template or settings edits rebuild it."""
+    import os
+    from unittest.mock import patch
+
+    from vandelay.agents.prompts import system_prompt
+
+    build_system_prompt(workspace_dir=tmp_workspace, settings=prompt_settings)
+    with patch.object(
+        system_prompt, "_build_system_body", wraps=system_prompt._build_system_body,
+    ) as body:
+        build_system_prompt(workspace_dir=tmp_workspace, settings=prompt_settings)
+        assert body.call_count == 0
+
+        soul = tmp_workspace / "SOUL.md"
+        soul.write_text("# Soul\n\nEdited soul.", encoding="utf-8")
+        st = soul.stat()
+        os.utime(soul, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        prompt = build_system_prompt(workspace_dir=tmp_workspace, settings=prompt_settings)
+        assert body.call_count == 1
+        assert "Edited soul." in prompt
+
+        prompt_settings.enabled_tools.append("python")
+        build_system_prompt(workspace_dir=tmp_workspace, settings=prompt_settings)
+        assert body.call_count == 2
+
+
+def test_bootstrap_included_on_cached_body(tmp_workspace):
+    """A BOOTSTRAP.md that appears after the body was cached is still read once."""
+    (tmp_workspace / "BOOTSTRAP.md").unlink(missing_ok=True)
+    build_system_prompt(workspace_dir=tmp_workspace)
+
+    (tmp_workspace / "BOOTSTRAP.md").write_text("# Bootstrap\n\nStep 1", encoding="utf-8")
+    assert "Step 1" in build_system_prompt(workspace_dir=tmp_workspace)
+    assert "Step 1" not in build_system_prompt(workspace_dir=tmp_workspace)
+
+
 def test_build_prompt_includes_tool_catalog(tmp_workspace, prompt_settings):
     """Prompt should include the enabled tools section when settings provided."""
     prompt = build_system_prompt(
@@ -275,6 +322,19 @@ class TestBuildAgentsSlim:
             result = _build_agents_slim(empty_ws)
         assert result == ""
 
+    def test_keeps_section_bodies_and_skips_preamble(self, tmp_path):
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        (ws / "AGENTS.md").write_text(
+            "# Agents\nintro\n## Delegation\ndrop me\n"
+            "## Safety Rules\n- be safe\n### Sub\nnested\n"
+            "## Working Directory\ndrop\n## Response Style\nshort\n",
+            encoding="utf-8",
+        )
+        assert _build_agents_slim(ws) == (
+            "## Safety Rules\n- be safe\n### Sub\nnested\n## Response Style\nshort"
+        )
+
 
 class TestBuildMemberRoster:
     def test_roster_includes_members(self, team_settings):
@@ -325,6 +385,17 @@ class TestBuildMemberRoster:
         result = _build_member_roster(settings)
         assert "| vandelay-expert |" in result
 
+    def test_roster_resolves_each_member_once(self, team_settings):
+        from unittest.mock import patch
+
+        import vandelay.agents.factory as factory
+
+        with patch.object(
+            factory, "_resolve_member", wraps=factory._resolve_member,
+        ) as resolve:
+            _build_member_roster(team_settings)
+        assert resolve.call_count == len(team_settings.team.members)
+
 
 # --- Deep work prompt tests ---
 
@@ -487,3 +558,51 @@ class TestCredentialsSummary:
 
         result = _build_credentials_summary()
         assert "not set up" in result
+
+    def test_ignores_commented_env_keys(self, tmp_path, monkeypatch):
+        """Commented-out keys are not reported; key case is normalized."""
+        vandelay_home = tmp_path / ".vandelay"
+        vandelay_home.mkdir()
+        (vandelay_home / ".env").write_text(
+            "# OPENAI_API_KEY=sk-old\r\ngithub_token=ghp-test\r\n"
+        )
+
+        import vandelay.config.constants as consts
+        monkeypatch.setattr(consts, "VANDELAY_HOME", vandelay_home)
+
+        result = _build_credentials_summary()
+        assert "GitHub" in result
+        assert "OpenAI" not in result
+
+
+class TestCurrentDatetime:
+    def test_reused_within_the_same_minute(self, monkeypatch):
+        import vandelay.agents.prompts.system_prompt as sp
+
+        monkeypatch.setattr(sp, "_now_cache", (-1, ""))
+        monkeypatch.setattr(sp.time, "time", lambda: 600.0)
+        first = sp._current_datetime()
+        monkeypatch.setattr(sp, "datetime", None)  # would fail if called again
+        assert sp._current_datetime() == first
+
+    def test_refreshed_on_next_minute(self, monkeypatch):
+        import vandelay.agents.prompts.system_prompt as sp
+
+        monkeypatch.setattr(sp, "_now_cache", (10, "stale"))
+        monkeypatch.setattr(sp.time, "time", lambda: 660.0)
+        assert sp._current_datetime() != "stale"
+
+
+class TestSharedRegistry:
+    def test_prompt_builder_uses_tool_manager_registry(self, monkeypatch):
+        from unittest.mock import MagicMock
+
+        import vandelay.tools.registry as registry_mod
+        from vandelay.tools.manager import ToolManager
+
+        fake = MagicMock()
+        monkeypatch.setattr(registry_mod, "_shared_registry", fake)
+
+        import vandelay.agents.prompts.system_prompt as sp
+
+        assert sp.get_registry() is ToolManager().registry is fake
@@ -18,8 +18,8 @@ class TestCreateTeam:
         defaults.update(overrides)
         return Settings(**defaults)
 
-    @patch("vandelay.knowledge.setup.create_knowledge")
-    @patch("agno.team.Team")
+    @patch("vandelay.agents.factory.create_knowledge")
+    @patch("vandelay.agents.factory.Team")
     @patch("vandelay.agents.factory._get_model")
     @patch("vandelay.agents.factory.create_db")
     @patch("vandelay.agents.factory.build_team_leader_prompt")
@@ -59,8 +59,8 @@ class TestCreateTeam:
         assert call_kwargs["name"] == "TestTeam"
         assert len(call_kwargs["members"]) == 2
 
-    @patch("vandelay.knowledge.setup.create_knowledge")
-    @patch("agno.team.Team")
+    @patch("vandelay.agents.factory.create_knowledge")
+    @patch("vandelay.agents.factory.Team")
     @patch("vandelay.agents.factory._get_model")
     @patch("vandelay.agents.factory.create_db")
     @patch("vandelay.agents.factory.build_team_leader_prompt")
@@ -94,8 +94,8 @@ class TestCreateTeam:
         call_kwargs = mock_team_cls.call_args[1]
         assert call_kwargs["user_id"] == "test@example.com"
 
-    @patch("vandelay.knowledge.setup.create_knowledge")
-    @patch("agno.team.Team")
+    @patch("vandelay.agents.factory.create_knowledge")
+    @patch("vandelay.agents.factory.Team")
     @patch("vandelay.agents.factory._get_model")
     @patch("vandelay.agents.factory.create_db")
     @patch("vandelay.agents.factory.build_team_leader_prompt")
@@ -127,8 +127,8 @@ class TestCreateTeam:
         call_kwargs = mock_team_cls.call_args[1]
         assert call_kwargs["user_id"] == "default"
 
-    @patch("vandelay.knowledge.setup.create_knowledge")
-    @patch("agno.team.Team")
+    @patch("vandelay.agents.factory.create_knowledge")
+    @patch("vandelay.agents.factory.Team")
     @patch("vandelay.agents.factory._get_model")
     @patch("vandelay.agents.factory.create_db")
     @patch("vandelay.agents.factory.build_team_leader_prompt")
@@ -161,8 +161,8 @@ class TestCreateTeam:
         assert call_kwargs["mode"] == "coordinate"
         assert call_kwargs["respond_directly"] is False
 
-    @patch("vandelay.knowledge.setup.create_knowledge")
-    @patch("agno.team.Team")
+    @patch("vandelay.agents.factory.create_knowledge")
+    @patch("vandelay.agents.factory.Team")
     @patch("vandelay.agents.factory._get_model")
     @patch("vandelay.agents.factory.create_db")
     @patch("vandelay.agents.factory.build_team_leader_prompt")
@@ -195,8 +195,8 @@ class TestCreateTeam:
         assert call_kwargs["mode"] == "route"
         assert call_kwargs["respond_directly"] is True
 
-    @patch("vandelay.knowledge.setup.create_knowledge")
-    @patch("agno.team.Team")
+    @patch("vandelay.agents.factory.create_knowledge")
+    @patch("vandelay.agents.factory.Team")
     @patch("vandelay.agents.factory._get_model")
     @patch("vandelay.agents.factory.create_db")
     @patch("vandelay.agents.factory.build_team_leader_prompt")
@@ -231,8 +231,8 @@ class TestCreateTeam:
         call_kwargs = mock_team_cls.call_args[1]
         assert len(call_kwargs["members"]) == 2
 
-    @patch("vandelay.knowledge.setup.create_knowledge")
-    @patch("agno.team.Team")
+    @patch("vandelay.agents.factory.create_knowledge")
+    @patch("vandelay.agents.factory.Team")
     @patch("vandelay.agents.factory._get_model")
     @patch("vandelay.agents.factory.create_db")
     @patch("vandelay.agents.factory.build_team_leader_prompt")
@@ -269,6 +269,119 @@ class TestCreateTeam:
         assert "WorkspaceTools" in tool_type_names
         assert "MemberManagementTools" in tool_type_names
 
+    @patch("vandelay.agents.factory.create_knowledge")
+    @patch("vandelay.agents.factory.Team")
+    @patch("vandelay.agents.factory._get_model")
+    @patch("vandelay.agents.factory.create_db")
+    @patch("vandelay.agents.factory.build_team_leader_prompt")
+    def test_members_keep_config_order(
+        self,
+        mock_prompt,
+        mock_db,
+        mock_model,
+        mock_team_cls,
+        mock_create_knowledge,
+        tmp_path,
+    ):
+        """Members are built concurrently but passed to Team in config order."""
+        from vandelay.agents.factory import create_team
+
+        mock_prompt.return_value = ["test"]
+        mock_db.return_value = MagicMock()
+        mock_model.return_value = MagicMock()
+        mock_team_cls.return_value = MagicMock()
+        mock_create_knowledge.return_value = None
+
+        names = [f"member{i}" for i in range(6)]
+        settings = self._make_settings(
+            team=TeamConfig(
+                enabled=True,
+                members=[MemberConfig(name=n, tools=[]) for n in names],
+            ),
+            workspace_dir=str(tmp_path),
+        )
+
+        with patch("vandelay.agents.factory.Agent") as mock_agent:
+            mock_agent.side_effect = lambda **kw: kw["id"]
+            create_team(settings)
+
+        members = mock_team_cls.call_args[1]["members"]
+        assert members == [f"vandelay-{n}" for n in names]
+
+    @patch("vandelay.agents.factory.create_embedder")
+    @patch("vandelay.agents.factory.create_knowledge")
+    @patch("vandelay.agents.factory.Team")
+    @patch("vandelay.agents.factory._get_model")
+    @patch("vandelay.agents.factory.create_db")
+    @patch("vandelay.agents.factory.build_team_leader_prompt")
+    def test_embedder_shared_across_collections(
+        self,
+        mock_prompt,
+        mock_db,
+        mock_model,
+        mock_team_cls,
+        mock_create_knowledge,
+        mock_create_embedder,
+        tmp_path,
+    ):
+        from vandelay.agents.factory import create_team
+
+        mock_prompt.return_value = ["test"]
+        embedder = MagicMock()
+        mock_create_embedder.return_value = embedder
+
+        settings = self._make_settings(
+            team=TeamConfig(
+                enabled=True,
+                members=[
+                    MemberConfig(name="a", knowledge_enabled=True),
+                    MemberConfig(name="b", knowledge_enabled=True),
+                ],
+            ),
+            workspace_dir=str(tmp_path),
+        )
+        with patch("vandelay.agents.factory.Agent"):
+            create_team(settings)
+
+        mock_create_embedder.assert_called_once()
+        assert mock_create_knowledge.call_count == 3
+        for call in mock_create_knowledge.call_args_list:
+            assert call.kwargs["embedder"] is embedder
+
+    @patch("vandelay.agents.factory.create_embedder")
+    @patch("vandelay.agents.factory.create_knowledge")
+    @patch("vandelay.agents.factory.Team")
+    @patch("vandelay.agents.factory._get_model")
+    @patch("vandelay.agents.factory.create_db")
+    @patch("vandelay.agents.factory.build_team_leader_prompt")
+    def test_knowledge_disabled_skips_setup(
+        self,
+        mock_prompt,
+        mock_db,
+        mock_model,
+        mock_team_cls,
+        mock_create_knowledge,
+        mock_create_embedder,
+        tmp_path,
+    ):
+        from vandelay.agents.factory import create_team
+
+        mock_prompt.return_value = ["test"]
+        settings = self._make_settings(
+            knowledge=KnowledgeConfig(enabled=False),
+            team=TeamConfig(
+                enabled=True,
+                members=[MemberConfig(name="a", knowledge_enabled=True)],
+            ),
+            workspace_dir=str(tmp_path),
+        )
+        with patch("vandelay.agents.factory.Agent"):
+            create_team(settings)
+
+        mock_create_embedder.assert_not_called()
+        mock_create_knowledge.assert_not_called()
+        assert mock_team_cls.call_args[1]["knowledge"] is None
+
 
 class TestMemberMemoryScoping:
     """Members get scoped user_id and memory; leader keeps global user_id."""
@@ -282,8 +395,8 @@ class TestMemberMemoryScoping:
         defaults.update(overrides)
         return Settings(**defaults)
 
-    @patch("vandelay.knowledge.setup.create_knowledge")
-    @patch("agno.team.Team")
+    @patch("vandelay.agents.factory.create_knowledge")
+    @patch("vandelay.agents.factory.Team")
     @patch("vandelay.agents.factory._get_model")
     @patch("vandelay.agents.factory.create_db")
     @patch("vandelay.agents.factory.build_team_leader_prompt")
@@ -318,8 +431,8 @@ class TestMemberMemoryScoping:
         agent_kwargs = mock_agent.call_args[1]
         assert agent_kwargs["user_id"] == "member_personal-assistant"
 
-    @patch("vandelay.knowledge.setup.create_knowledge")
-    @patch("agno.team.Team")
+    @patch("vandelay.agents.factory.create_knowledge")
+    @patch("vandelay.agents.factory.Team")
     @patch("vandelay.agents.factory._get_model")
     @patch("vandelay.agents.factory.create_db")
     @patch("vandelay.agents.factory.build_team_leader_prompt")
@@ -353,8 +466,8 @@ class TestMemberMemoryScoping:
         agent_kwargs = mock_agent.call_args[1]
         assert agent_kwargs["update_memory_on_run"] is True
 
-    @patch("vandelay.knowledge.setup.create_knowledge")
-    @patch("agno.team.Team")
+    @patch("vandelay.agents.factory.create_knowledge")
+    @patch("vandelay.agents.factory.Team")
     @patch("vandelay.agents.factory._get_model")
     @patch("vandelay.agents.factory.create_db")
     @patch("vandelay.agents.factory.build_team_leader_prompt")
@@ -389,8 +502,8 @@ class TestMemberMemoryScoping:
         team_kwargs = mock_team_cls.call_args[1]
         assert team_kwargs["user_id"] == "shaun@agno.com"
 
-    @patch("vandelay.knowledge.setup.create_knowledge")
-    @patch("agno.team.Team")
+    @patch("vandelay.agents.factory.create_knowledge")
+    @patch("vandelay.agents.factory.Team")
     @patch("vandelay.agents.factory._get_model")
     @patch("vandelay.agents.factory.create_db")
     @patch("vandelay.agents.factory.build_team_leader_prompt")
@@ -435,7 +548,7 @@ class TestMemberMemoryScoping:
 class TestBackwardCompatibility:
     """Ensure create_agent still works independently of team mode."""
 
-    @patch("vandelay.knowledge.setup.create_knowledge")
+    @patch("vandelay.agents.factory.create_knowledge")
     @patch("vandelay.agents.factory.Agent")
     @patch("vandelay.agents.factory._get_model")
     @patch("vandelay.agents.factory._get_tools")
@@ -87,3 +87,12 @@ class TestListTemplates:
         templates = list_templates()
         for t in templates:
             assert isinstance(t, StarterTemplate)
+
+    def test_returns_fresh_list(self):
+        templates = list_templates()
+        templates.clear()
+        assert len(list_templates()) == 14
+
+    def test_registry_is_read_only(self):
+        with pytest.raises(TypeError):
+            STARTER_TEMPLATES["new"] = STARTER_TEMPLATES["cto"]  # type: ignore[index]
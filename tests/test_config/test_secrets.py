@@ -71,6 +71,22 @@ class TestReadEnvFile:
         result = read_env_file(tmp_path / "missing.env")
         assert result == {}
 
+    def test_crlf_and_malformed_lines(self, tmp_path: Path):
+        env_path = tmp_path / ".env"
+        env_path.write_bytes(b"  A = 1 \r\nnot a pair\r\n=orphan\r\n  # KEY=x\r\nB=x=y\r\n")
+        result = read_env_file(env_path)
+        assert result == {"A": "1", "B": "x=y"}
+
+    def test_lone_cr_line_endings(self, tmp_path: Path):
+        env_path = tmp_path / ".env"
+        env_path.write_bytes(b"A=1\r# KEY=x\rB=2\x0cC=3\r")
+        assert read_env_file(env_path) == {"A": "1", "B": "2", "C": "3"}
+
+    def test_last_duplicate_wins(self, tmp_path: Path):
+        env_path = tmp_path / ".env"
+        env_path.write_text("A=1\nA=2\n", encoding="utf-8")
+        assert read_env_file(env_path) == {"A": "2"}
+
 
 # ---------------------------------------------------------------------------
 # model_dump excludes secret fields
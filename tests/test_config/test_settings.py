@@ -41,3 +41,12 @@ def test_settings_save_and_load(tmp_path):
     # Verify it's valid JSON
     data = json.loads(config_path.read_text())
     assert data["agent_name"] == "RoundTrip"
+
+
+def test_workspace_path_tracks_workspace_dir(tmp_path):
+    s = Settings(agent_name="Test", workspace_dir=str(tmp_path / "a"))
+    assert s.workspace_path == tmp_path / "a"
+    assert s.workspace_path is s.workspace_path
+
+    s.workspace_dir = str(tmp_path / "b")
+    assert s.workspace_path == tmp_path / "b"
@@ -17,6 +17,16 @@ from vandelay.knowledge.embedder import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_embedder_cache():
+    """Embedders are memoized per signature; tests patch builders per case."""
+    from vandelay.knowledge.embedder import _embedder_cache
+
+    _embedder_cache.clear()
+    yield
+    _embedder_cache.clear()
+
+
 def _make_settings(
     provider: str = "openai",
     embedder_provider: str = "",
@@ -316,3 +326,18 @@ class TestBuildOpenrouter:
             ):
                 result = _build_openrouter(settings)
                 assert result is mock_fastembed.return_value
+
+
+class TestEmbedderCache:
+    def test_same_signature_reuses_embedder(self):
+        settings = _make_settings(provider="ollama")
+        builder = MagicMock(side_effect=lambda s: MagicMock())
+        with patch.dict("vandelay.knowledge.embedder._EMBEDDER_BUILDERS", {"ollama": builder}):
+            first = create_embedder(settings)
+            assert create_embedder(settings) is first
+            other = create_embedder(
+                _make_settings(provider="ollama", embedder_base_url="http://other:11434")
+            )
+
+        assert other is not first
+        assert builder.call_count == 2
@@ -12,18 +12,34 @@ from vandelay.config.settings import Settings
 from vandelay.knowledge.setup import create_knowledge
 
 
+@pytest.fixture(autouse=True)
+def _fresh_knowledge_caches():
+    """Knowledge and embedders are memoized; tests patch builders per case."""
+    from vandelay.knowledge.embedder import _embedder_cache
+    from vandelay.knowledge.setup import _knowledge_cache
+
+    _embedder_cache.clear()
+    _knowledge_cache.clear()
+    yield
+    _embedder_cache.clear()
+    _knowledge_cache.clear()
+
+
 def _make_settings(
     knowledge_enabled: bool = True,
     provider: str = "openai",
     embedder_provider: str = "",
     workspace_dir: str = "",
+    embedder_base_url: str = "",
 ) -> Settings:
     return Settings(
         agent_name="Test",
         model=ModelConfig(provider=provider),
         knowledge=KnowledgeConfig(
             enabled=knowledge_enabled,
-            embedder=EmbedderConfig(provider=embedder_provider),
+            embedder=EmbedderConfig(
+                provider=embedder_provider, base_url=embedder_base_url,
+            ),
         ),
         workspace_dir=workspace_dir or ".",
     )
@@ -48,6 +64,19 @@ class TestCreateKnowledge:
         result = create_knowledge(settings)
         assert result is None
 
+    @patch("vandelay.knowledge.setup.create_embedder")
+    def test_prebuilt_embedder_is_reused(self, mock_create_embedder):
+        embedder = MagicMock()
+        settings = _make_settings()
+
+        with patch(
+            "vandelay.knowledge.vectordb.create_vector_db", return_value=None,
+        ) as mock_vdb:
+            create_knowledge(settings, embedder=embedder)
+
+        mock_create_embedder.assert_not_called()
+        assert mock_vdb.call_args[0][0] is embedder
+
     @patch("vandelay.knowledge.setup.create_embedder")
     def test_no_vector_db_returns_none(self, mock_create_embedder):
         """Gracefully handle no vector DB available."""
@@ -103,3 +132,45 @@ class TestCreateKnowledge:
             result = create_knowledge(settings)
             assert result is None
             mock.assert_not_called()
+
+    def test_knowledge_reused_for_same_collection(self, tmp_path):
+        """Rebuilds with the same embedder signature and db share one instance."""
+        embedder = MagicMock()
+        db = MagicMock()
+        settings = _make_settings(workspace_dir=str(tmp_path))
+
+        with patch(
+            "vandelay.knowledge.vectordb.create_vector_db", return_value=MagicMock(),
+        ) as mock_vdb:
+            first = create_knowledge(settings, db=db, embedder=embedder)
+            second = create_knowledge(settings, db=db, embedder=embedder)
+            other = create_knowledge(settings, db=db, member_name="cto", embedder=embedder)
+
+        assert first is second
+        assert other is not first
+        assert mock_vdb.call_count == 2
+
+    def test_cache_hit_skips_embedder_build(self, tmp_path):
+        """An unchanged config is served from cache without building an embedder."""
+        settings = _make_settings(workspace_dir=str(tmp_path))
+
+        with (
+            patch("vandelay.knowledge.setup.create_embedder", return_value=MagicMock()) as mock,
+            patch("vandelay.knowledge.vectordb.create_vector_db", return_value=MagicMock()),
+        ):
+            first = create_knowledge(settings)
+            second = create_knowledge(settings)
+
+        assert first is second
+        mock.assert_called_once()
+
+    def test_embedder_endpoint_change_rebuilds(self, tmp_path):
+        """A new embedder base_url must not reuse the old vector store wiring."""
+        old = _make_settings(workspace_dir=str(tmp_path), embedder_base_url="http://a:11434")
+        new = _make_settings(workspace_dir=str(tmp_path), embedder_base_url="http://b:11434")
+
+        with (
+            patch("vandelay.knowledge.setup.create_embedder", return_value=MagicMock()),
+            patch("vandelay.knowledge.vectordb.create_vector_db", return_value=MagicMock()),
+        ):
+            assert create_knowledge(old) is not create_knowledge(new)
@@ -0,0 +1,130 @@
+"""Tests for Codex OAuth credential loading."""
+
+import base64
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from vandelay.models import openai_codex
+from vandelay.models.openai_codex import _invalidate_codex_cache, load_codex_credentials
+
+
+def _jwt(exp: float) -> str:
+    claims = {"exp": exp, openai_codex._JWT_AUTH_CLAIM: {"chatgpt_account_id": "acct-1"}}
+    body = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip("=")
+    return f"header.{body}.sig"
+
+
+@pytest.fixture
+def codex_home(tmp_path, monkeypatch):
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+    (tmp_path / ".codex").mkdir()
+    _invalidate_codex_cache()
+    yield tmp_path / ".codex" / "auth.json"
+    _invalidate_codex_cache()
+
+
+class TestLoadCodexCredentials:
+    def test_missing_file_returns_none(self, codex_home):
+        assert load_codex_credentials() is None
+
+    def test_unchanged_file_is_served_from_cache(self, codex_home):
+        token = _jwt(time.time() + 3600)
+        codex_home.write_text(json.dumps({"tokens": {"access_token": token}}))
+        assert load_codex_credentials() == (token, "acct-1")
+
+        with patch.object(openai_codex, "_decode_jwt_payload", side_effect=AssertionError):
+            assert load_codex_credentials() == (token, "acct-1")
+
+    def test_deleted_file_forces_reload(self, codex_home):
+        token = _jwt(time.time() + 3600)
+        codex_home.write_text(json.dumps({"tokens": {"access_token": token}}))
+        load_codex_credentials()
+
+        codex_home.unlink()
+        assert load_codex_credentials() is None
+
+    def test_changed_file_forces_reload(self, codex_home):
+        import os
+
+        old = _jwt(time.time() + 3600)
+        codex_home.write_text(json.dumps({"tokens": {"access_token": old}}))
+        load_codex_credentials()
+
+        new = _jwt(time.time() + 7200)
+        codex_home.write_text(json.dumps({"tokens": {"access_token": new}}))
+        st = codex_home.stat()
+        os.utime(codex_home, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert load_codex_credentials() == (new, "acct-1")
+
+    def test_invalidate_forces_reread(self, codex_home):
+        token = _jwt(time.time() + 3600)
+        codex_home.write_text(json.dumps({"tokens": {"access_token": token}}))
+        load_codex_credentials()
+
+        codex_home.unlink()
+        _invalidate_codex_cache()
+        assert load_codex_credentials() is None
+
+    def test_expiring_token_is_not_served_from_cache(self, codex_home):
+        token = _jwt(time.time() + 60)
+        codex_home.write_text(json.dumps({"tokens": {"access_token": token}}))
+        load_codex_credentials()
+
+        codex_home.unlink()
+        assert load_codex_credentials() is None
+
+
+def _oauth_client(payload: dict) -> MagicMock:
+    client = MagicMock()
+    client.post.return_value.json.return_value = payload
+    return client
+
+
+class TestCodexRefresh:
+    def test_refreshed_token_is_written(self, codex_home):
+        old = _jwt(time.time() + 60)
+        new = _jwt(time.time() + 3600)
+        codex_home.write_text(
+            json.dumps({"tokens": {"access_token": old, "refresh_token": "r1"}})
+        )
+
+        client = _oauth_client({"access_token": new, "refresh_token": "r2"})
+        with patch.object(openai_codex, "_http_client", return_value=client):
+            assert load_codex_credentials() == (new, "acct-1")
+
+        assert client.post.call_args.kwargs["data"]["refresh_token"] == "r1"
+
+        saved = json.loads(codex_home.read_text())
+        assert saved["tokens"] == {"access_token": new, "refresh_token": "r2"}
+        assert "last_refresh" in saved
+        assert list(codex_home.parent.iterdir()) == [codex_home]
+
+    def test_refresh_preserves_file_mode(self, codex_home):
+        import os
+        import stat
+
+        codex_home.write_text(
+            json.dumps({"tokens": {"access_token": _jwt(time.time() + 60), "refresh_token": "r1"}})
+        )
+        os.chmod(codex_home, 0o600)
+
+        client = _oauth_client({"access_token": _jwt(time.time() + 3600)})
+        with patch.object(openai_codex, "_http_client", return_value=client):
+            load_codex_credentials()
+
+        assert "last_refresh" in json.loads(codex_home.read_text())
+        assert stat.S_IMODE(codex_home.stat().st_mode) == 0o600
+
+    def test_unchanged_tokens_skip_write(self, codex_home):
+        token = _jwt(time.time() + 60)
+        original = json.dumps({"tokens": {"access_token": token, "refresh_token": "r1"}})
+        codex_home.write_text(original)
+
+        client = _oauth_client({"access_token": token})
+        with patch.object(openai_codex, "_http_client", return_value=client):
+            load_codex_credentials()
+
+        assert codex_home.read_text() == original
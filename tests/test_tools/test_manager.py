@@ -245,3 +245,36 @@ def test_file_replace_blocked_outside_allowed():
         file_name=path, start_line=1, end_line=5, chunk="bad",
     )
     assert "BLOCKED" in result
+
+
+def test_concurrent_instantiate_constructs_in_parallel(monkeypatch):
+    """Members built on separate threads construct their toolkits concurrently."""
+    import sys
+    import threading
+    import types
+    from concurrent.futures import ThreadPoolExecutor
+    from unittest.mock import MagicMock
+
+    from vandelay.tools.registry import ToolEntry
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class SlowTools:
+        def __init__(self) -> None:
+            print("constructor noise")
+            barrier.wait()  # only passes if both constructors overlap
+
+    monkeypatch.setitem(sys.modules, "fake_slow_tools", types.SimpleNamespace(SlowTools=SlowTools))
+    registry = MagicMock()
+    registry.get.return_value = ToolEntry(
+        name="slow", module_path="fake_slow_tools", class_name="SlowTools",
+    )
+    manager = ToolManager(registry=registry)
+
+    real_stdout = sys.stdout
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(manager.instantiate_tools, ["slow"]) for _ in range(2)]
+        results = [f.result() for f in futures]
+
+    assert all(len(r) == 1 for r in results)
+    assert sys.stdout is real_stdout
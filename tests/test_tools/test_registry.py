@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pytest
 
-from vandelay.tools.registry import ToolEntry, ToolRegistry
+from vandelay.tools.registry import ToolEntry, ToolRegistry, get_registry
 
 
 @pytest.fixture
@@ -51,6 +51,73 @@ def test_cache_persists(tmp_path: Path):
     assert len(reg2.tools) == len(reg1.tools)
 
 
+def test_reload_if_stale_picks_up_external_refresh(tmp_path: Path):
+    """A long-lived registry re-reads the cache file after another writer updates it."""
+    import os
+
+    cache_file = tmp_path / "tool_registry.json"
+    ToolRegistry(cache_path=cache_file).refresh()
+
+    reg = ToolRegistry(cache_path=cache_file)
+    assert "shell" in reg.tools
+    reg.reload_if_stale()
+    assert "shell" in reg.tools  # unchanged file keeps the loaded cache
+
+    data = json.loads(cache_file.read_text(encoding="utf-8"))
+    del data["tools"]["shell"]
+    cache_file.write_text(json.dumps(data), encoding="utf-8")
+    st = cache_file.stat()
+    os.utime(cache_file, (st.st_atime, st.st_mtime + 5))
+
+    reg.reload_if_stale()
+    assert "shell" not in reg.tools
+
+
+def test_get_registry_reused_and_revalidated(monkeypatch):
+    """The shared accessor builds one registry and revalidates it on reuse."""
+    from unittest.mock import MagicMock
+
+    import vandelay.tools.registry as registry_mod
+
+    fake = MagicMock()
+    factory = MagicMock(return_value=fake)
+    monkeypatch.setattr(registry_mod, "_shared_registry", None)
+    monkeypatch.setattr(registry_mod, "ToolRegistry", factory)
+
+    assert get_registry() is fake
+    fake.reload_if_stale.assert_not_called()
+    assert get_registry() is fake
+    fake.reload_if_stale.assert_called_once()
+    factory.assert_called_once()
+
+
+def test_concurrent_first_access_discovers_once(tmp_path: Path, monkeypatch):
+    """Threads racing on a cold registry run discovery a single time."""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    reg = ToolRegistry(cache_path=tmp_path / "tool_registry.json")
+    calls = []
+    real_refresh = reg.refresh
+    gate = threading.Event()
+
+    def slow_refresh() -> int:
+        calls.append(1)
+        gate.wait(1)
+        time.sleep(0.05)
+        return real_refresh()
+
+    monkeypatch.setattr(reg, "refresh", slow_refresh)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(lambda: reg.tools) for _ in range(4)]
+        gate.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+
 def test_search_by_name(tmp_registry: ToolRegistry):
     """search() should find tools by name substring."""
     tmp_registry.refresh()
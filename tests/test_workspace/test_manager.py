@@ -74,6 +74,39 @@ class TestGetTemplateContent:
         result = get_template_content("SOUL.md", workspace_dir=ws)
         assert "My Custom Soul" in result
 
+    def test_shipped_template_read_once(self, tmp_path: Path):
+        """Fallbacks reuse the cached shipped template instead of re-reading it."""
+        from unittest.mock import patch
+
+        from vandelay.workspace.manager import _shipped_template
+
+        ws = tmp_path / "workspace"
+        ws.mkdir()
+        _shipped_template.cache_clear()
+        first = get_template_content("HEARTBEAT.md", workspace_dir=ws)
+
+        with patch.object(Path, "read_text", side_effect=FileNotFoundError):
+            assert get_template_content("HEARTBEAT.md", workspace_dir=ws) == first
+
+    def test_user_file_cached_until_modified(self, tmp_path: Path):
+        """Unchanged user files are served from cache; edits are picked up."""
+        import os
+        from unittest.mock import patch
+
+        ws = tmp_path / "workspace"
+        ws.mkdir()
+        soul = ws / "SOUL.md"
+        soul.write_text("# Soul v1", encoding="utf-8")
+        assert get_template_content("SOUL.md", workspace_dir=ws) == "# Soul v1"
+
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            assert get_template_content("SOUL.md", workspace_dir=ws) == "# Soul v1"
+
+        soul.write_text("# Soul version 2", encoding="utf-8")
+        st = soul.stat()
+        os.utime(soul, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert get_template_content("SOUL.md", workspace_dir=ws) == "# Soul version 2"
+
 
 class TestInitWorkspace:
     """init_workspace() creates directories and copies templates if missing."""